@@ -501,38 +501,42 @@ class RobotControl(QObject, threading.Thread):
                 self.running = True
                 while self.running:
                     try:
-                        # 使用线程锁保护Robot对象访问
+                        # 使用线程锁保护Robot对象访问，锁内只做RDK调用，信号在锁外发送
                         with self.robot_lock:
                             # 检查连接状态
-                            if not self.robot.connected():
-                                self.status_updated.emit("机器人连接断开")
-                                # 发送断开连接信号
-                                self.signal_manager.emit(SignalType.ROBOT_DISCONNECTED, {"robot_id": self.robot_id})
-                                # 不直接退出，而是尝试重新连接
-                                self.status_updated.emit("尝试重新连接机器人...")
+                            connected = self.robot.connected()
+                            if connected:
+                                # 获取机器人状态数据
+                                robot_states = self.robot.states()
+                                fault = self.robot.fault()
+                                operational = not fault and self.robot.operational()
+                                # 机器人模式
+                                current_mode = self.robot.mode()
+                            else:
                                 # 设置标志以便重新进入连接初始化流程
                                 self.robot = None
-                                # 跳出内层循环，重新进入外层连接初始化流程
-                                break
-                            
-                            # 获取机器人状态数据
-                            robot_states = self.robot.states()
-                            
-                            # 检查机器人状态
-                            if self.robot.fault():
-                                self.status_updated.emit("机器人故障状态")
-                                # 注意：不要自动清除故障，应该由用户手动处理
-                                # self.robot.ClearFault()
-                                # 发送系统错误信号
-                                self.signal_manager.emit(SignalType.SYSTEM_ERROR, {"error": "机器人故障状态"})
-                            elif self.robot.operational():
-                                pass  # 正常运行，不频繁更新状态信息
-                            else:
-                                self.status_updated.emit("机器人已连接但未使能")
-                            
-                            # 机器人模式
-                            current_mode = self.robot.mode()
-                            self.mode_updated.emit(str(current_mode))
+                        
+                        if not connected:
+                            self.status_updated.emit("机器人连接断开")
+                            # 发送断开连接信号
+                            self.signal_manager.emit(SignalType.ROBOT_DISCONNECTED, {"robot_id": self.robot_id})
+                            # 不直接退出，而是尝试重新连接
+                            self.status_updated.emit("尝试重新连接机器人...")
+                            # 跳出内层循环，重新进入外层连接初始化流程
+                            break
+                        
+                        # 检查机器人状态
+                        if fault:
+                            self.status_updated.emit("机器人故障状态")
+                            # 注意：不要自动清除故障，应该由用户手动处理
+                            # self.robot.ClearFault()
+                            # 发送系统错误信号
+                            self.signal_manager.emit(SignalType.SYSTEM_ERROR, {"error": "机器人故障状态"})
+                        elif operational:
+                            pass  # 正常运行，不频繁更新状态信息
+                        else:
+                            self.status_updated.emit("机器人已连接但未使能")
+                        self.mode_updated.emit(str(current_mode))
                         
                         # 在锁外处理数据，避免长时间持有锁
                         # 发送完整的状态对象
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union, Callable, Tuple
+from typing import List, Optional, Dict, Any, Union, Callable, Tuple, Sequence
 import threading
 import logging
 import time
 import subprocess
 import socket
 
+import numpy as np
+
 from ...config.constants import RobotState, GripperState, MotionPrimitive
 from ...config.settings import ROBOT_CONFIG
 
@@ -46,27 +48,27 @@ class BaseRobotControl(ABC):
         pass
     
     @abstractmethod
-    def get_joint_positions(self) -> List[float]:
-        """获取关节位置"""
+    def get_joint_positions(self) -> np.ndarray:
+        """获取关节位置，返回形状为(7,)的数组(弧度)"""
         pass
     
     @abstractmethod
-    def get_joint_velocities(self) -> List[float]:
-        """获取关节速度"""
+    def get_joint_velocities(self) -> np.ndarray:
+        """获取关节速度，返回形状为(7,)的数组(弧度/秒)"""
         pass
     
     @abstractmethod
-    def get_joint_torques(self) -> List[float]:
-        """获取关节力矩"""
+    def get_joint_torques(self) -> np.ndarray:
+        """获取关节力矩，返回形状为(7,)的数组(Nm)"""
         pass
     
     @abstractmethod
-    def get_tcp_pose(self) -> List[float]:
-        """获取TCP位姿"""
+    def get_tcp_pose(self) -> np.ndarray:
+        """获取TCP位姿，返回形状为(7,)的数组[x, y, z, qw, qx, qy, qz]"""
         pass
     
     @abstractmethod
-    def move_joint(self, target_positions: List[float], 
+    def move_joint(self, target_positions: Union[Sequence[float], np.ndarray], 
                   speed: float = 1.0, 
                   primitive: MotionPrimitive = MotionPrimitive.JOINT_MOVE) -> bool:
         """关节运动"""
@@ -6,7 +6,8 @@ import numpy as np
 import threading
 import logging
 import time
-from typing import List, Optional, Dict, Any, Union, Callable
+from collections import deque
+from typing import List, Optional, Dict, Any, Union, Callable, Sequence, Deque
 
 from PyQt5.QtCore import QObject
 from ...utils.core.signal_manager import get_signal_manager, SignalType, SignalData
@@ -42,10 +43,21 @@ class HardwareRobotControl(BaseRobotControl, QObject):
         
         # 线程安全控制
         self._running = False
+        self._stop_event = threading.Event()  # 停止事件，用于立即唤醒监控线程
         self._robot_lock = threading.RLock()  # 可重入锁，保护机器人对象访问
         self._state_lock = threading.RLock()  # 状态变量保护锁
         self._monitor_lock = threading.RLock()  # 监控线程保护锁
         
+        # 信号分发队列（监控线程只负责入队，由分发线程调用信号管理器）
+        self._signal_queue: Deque[SignalData] = deque(maxlen=256)  # 队列满时丢弃最旧的信号
+        self._signal_event = threading.Event()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_stop: Optional[threading.Event] = None  # 当前分发线程的退出事件
+        self._dispatch_lock = threading.Lock()
+        self._signal_manager_alive = True  # 信号管理器失效时暂停发射
+        self._signal_retry_time = 0.0
+        self._signal_retry_delay = 1.0
+        
         # 状态变量（线程安全访问）
         self.joint_angles = [0.0] * 7
         self.joint_velocities = [0.0] * 7
@@ -136,6 +148,8 @@ class HardwareRobotControl(BaseRobotControl, QObject):
         except Exception as e:
             self._emit_signal(SignalType.ERROR, f"断开连接失败: {str(e)}")
             return False
+        finally:
+            self._stop_dispatch_thread()
 
     def enable(self) -> bool:
         """使能机器人
@@ -168,8 +182,8 @@ class HardwareRobotControl(BaseRobotControl, QObject):
                     
                     # 等待使能完成
                     enable_timeout = 30.0
-                    start_time = time.time()
-                    while time.time() - start_time < enable_timeout:
+                    start_time = time.monotonic()
+                    while time.monotonic() - start_time < enable_timeout:
                         if self.robot.operational():
                             break
                         time.sleep(0.1)
@@ -217,55 +231,55 @@ class HardwareRobotControl(BaseRobotControl, QObject):
         """
         return self._state
 
-    def get_joint_positions(self) -> List[float]:
+    def get_joint_positions(self) -> np.ndarray:
         """获取关节位置
-        输出: 7个关节的角度列表(弧度制)
+        输出: 形状为(7,)的关节角度数组(弧度制)
         """
         if self.robot and self.robot.connected():
             try:
                 states = self.robot.states()
-                return list(states.q)
+                return np.array(states.q, dtype=np.float64)
             except Exception as e:
                 self._logger.warning(f"获取关节位置失败: {e}")
-        return self.joint_angles.copy()
+        return np.array(self.joint_angles, dtype=np.float64)
 
-    def get_joint_velocities(self) -> List[float]:
+    def get_joint_velocities(self) -> np.ndarray:
         """获取关节速度
-        输出: 7个关节的速度列表(弧度/秒)
+        输出: 形状为(7,)的关节速度数组(弧度/秒)
         """
         if self.robot and self.robot.connected():
             try:
                 states = self.robot.states()
-                return list(states.dq)
+                return np.array(states.dq, dtype=np.float64)
             except Exception as e:
                 self._logger.warning(f"获取关节速度失败: {e}")
-        return [0.0] * 7
+        return np.zeros(7)
 
-    def get_joint_torques(self) -> List[float]:
+    def get_joint_torques(self) -> np.ndarray:
         """获取关节力矩
-        输出: 7个关节的力矩列表(Nm)
+        输出: 形状为(7,)的关节力矩数组(Nm)
         """
         if self.robot and self.robot.connected():
             try:
                 states = self.robot.states()
-                return list(states.tau)
+                return np.array(states.tau, dtype=np.float64)
             except Exception as e:
                 self._logger.warning(f"获取关节力矩失败: {e}")
-        return [0.0] * 7
+        return np.zeros(7)
 
-    def get_tcp_pose(self) -> List[float]:
+    def get_tcp_pose(self) -> np.ndarray:
         """获取TCP位姿
-        输出: TCP位姿列表[x, y, z, qw, qx, qy, qz]
+        输出: 形状为(7,)的TCP位姿数组[x, y, z, qw, qx, qy, qz]
         """
         if self.robot and self.robot.connected():
             try:
                 states = self.robot.states()
-                return list(states.tcp_pose)
+                return np.array(states.tcp_pose, dtype=np.float64)
             except Exception as e:
                 self._logger.warning(f"获取TCP位姿失败: {e}")
-        return [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+        return np.array([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
 
-    def move_joint(self, target_positions: List[float], 
+    def move_joint(self, target_positions: Union[Sequence[float], np.ndarray], 
                   speed: float = 1.0, 
                   primitive: MotionPrimitive = MotionPrimitive.JOINT_MOVE) -> bool:
         """关节运动
@@ -316,12 +330,15 @@ class HardwareRobotControl(BaseRobotControl, QObject):
         """开始监控机器人状态"""
         if not self._running:
             self._running = True
+            self._stop_event.clear()
             self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
 
     def stop_monitoring(self):
         """停止监控机器人状态"""
         self._running = False
+        self._stop_event.set()
+        self._stop_dispatch_thread()
 
     def _monitor_loop(self):
         """机器人状态监控循环"""
@@ -336,19 +353,13 @@ class HardwareRobotControl(BaseRobotControl, QObject):
                         # 获取机器人状态
                         states = self.robot.states()
                         
-                        # 更新状态变量（线程安全）
-                        with self._state_lock:
-                            self.joint_angles = list(states.q)
-                            self.joint_velocities = list(states.dq)
-                            self.joint_torques = list(states.tau)
-                            self.tcp_pose = list(states.tcp_pose)
-                        
-                        # 发射状态更新信号
-                        self._emit_signal(SignalType.JOINT_UPDATE, self.joint_angles)
-                        self._emit_signal(SignalType.CUSTOM, self.joint_velocities, "joint_velocity")
-                        self._emit_signal(SignalType.CUSTOM, self.joint_torques, "joint_torque")
-                        self._emit_signal(SignalType.TCP_UPDATE, self.tcp_pose)
-                        self._emit_signal(SignalType.CUSTOM, states, "robot_states")
+                        # 更新状态变量，仅在状态变化时发射信号
+                        if self._update_state_buffers(states):
+                            self._emit_signal(SignalType.JOINT_UPDATE, self.joint_angles)
+                            self._emit_signal(SignalType.CUSTOM, self.joint_velocities, "joint_velocity")
+                            self._emit_signal(SignalType.CUSTOM, self.joint_torques, "joint_torque")
+                            self._emit_signal(SignalType.TCP_UPDATE, self.tcp_pose)
+                            self._emit_signal(SignalType.CUSTOM, states, "robot_states")
                         
                         # 更新模式
                         current_mode = self.robot.mode()
@@ -365,7 +376,7 @@ class HardwareRobotControl(BaseRobotControl, QObject):
                         # 重置错误计数
                         error_count = 0
                     
-                time.sleep(monitor_interval)
+                self._stop_event.wait(monitor_interval)
                 
             except Exception as e:
                 error_count += 1
@@ -379,31 +390,116 @@ class HardwareRobotControl(BaseRobotControl, QObject):
                 
                 # 错误恢复延迟
                 recovery_delay = min(1.0, 0.1 * error_count)
-                time.sleep(recovery_delay)
+                self._stop_event.wait(recovery_delay)
+    
+    def _update_state_buffers(self, states) -> bool:
+        """将RDK状态拷贝到状态变量
+        输入: states - 机器人状态对象
+        输出: 状态发生变化返回True, 否则返回False
+        """
+        q = list(states.q)
+        dq = list(states.dq)
+        tau = list(states.tau)
+        tcp_pose = list(states.tcp_pose)
+        
+        with self._state_lock:
+            changed = (q != self.joint_angles or dq != self.joint_velocities or
+                       tau != self.joint_torques or tcp_pose != self.tcp_pose)
+            if changed:
+                self.joint_angles = q
+                self.joint_velocities = dq
+                self.joint_torques = tau
+                self.tcp_pose = tcp_pose
+        return changed
     
     def _emit_signal(self, signal_type: SignalType, data: Any, custom_type: str = None) -> bool:
-        """发射信号到信号管理器
+        """将信号放入分发队列（不等待信号处理器执行）
         输入: signal_type - 信号类型, data - 信号数据, custom_type - 自定义信号类型
-        输出: 发射成功返回True, 失败返回False
+        输出: 入队成功返回True, 失败返回False
         """
+        if not self._signal_manager_alive:
+            if time.monotonic() < self._signal_retry_time:
+                return False
+            self._signal_manager_alive = True
+        
         try:
-            metadata = {"source": self._robot_id, "class": "HardwareRobotControl"}
+            metadata = {"source": self.robot_id, "class": "HardwareRobotControl"}
             if custom_type:
                 metadata["custom_type"] = custom_type
             
             signal_data = SignalData(
                 signal_type=signal_type,
-                source=self._robot_id,
+                source=self.robot_id,
                 timestamp=time.time(),
                 data=data,
                 metadata=metadata
             )
             
-            return self._signal_manager.emit_signal(signal_data)
+            self._ensure_dispatch_thread()
+            self._signal_queue.append(signal_data)
+            self._signal_event.set()
+            return True
             
         except Exception as e:
-            self._logger.error(f"信号发射失败: {e}")
+            self._logger.error("信号发射失败: %s", e)
             return False
+    
+    def _ensure_dispatch_thread(self):
+        """确保信号分发线程已启动"""
+        if self._dispatch_thread is not None:
+            return
+        with self._dispatch_lock:
+            if self._dispatch_thread is None:
+                self._dispatch_stop = threading.Event()
+                self._dispatch_thread = threading.Thread(
+                    target=self._dispatch_loop,
+                    args=(self._dispatch_stop,),
+                    name="HardwareSignalDispatcher",
+                    daemon=True
+                )
+                self._dispatch_thread.start()
+    
+    def _stop_dispatch_thread(self, timeout: float = 1.0):
+        """停止信号分发线程，线程退出前会发送完队列中剩余的信号
+        输入: timeout - 等待线程退出的最长时间(秒)
+        输出: 无返回值
+        """
+        with self._dispatch_lock:
+            thread, stop_event = self._dispatch_thread, self._dispatch_stop
+            self._dispatch_thread = None
+            self._dispatch_stop = None
+        if thread is None:
+            return
+        stop_event.set()
+        self._signal_event.set()
+        # 信号处理器中调用停止时不能等待自身
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+    
+    def _dispatch_loop(self, stop_event: threading.Event):
+        """信号分发循环 - 将队列中的信号发送到信号管理器
+        输入: stop_event - 本线程的退出事件，置位后发送完剩余信号即退出
+        输出: 无返回值
+        """
+        while True:
+            self._signal_event.wait()
+            self._signal_event.clear()
+            while self._signal_queue:
+                signal_data = self._signal_queue.popleft()
+                try:
+                    if not self._signal_manager.emit_signal(signal_data):
+                        self._mark_signal_manager_failed()
+                except Exception as e:
+                    self._mark_signal_manager_failed()
+                    self._logger.error("信号分发失败: %s", e)
+            if stop_event.is_set():
+                return
+    
+    def _mark_signal_manager_failed(self):
+        """标记信号管理器失效，在退避时间内跳过信号发射"""
+        self._signal_manager_alive = False
+        self._signal_retry_time = time.monotonic() + self._signal_retry_delay
+        self._signal_queue.clear()
 
     def _handle_robot_fault(self):
         """处理机器人故障"""
@@ -6,7 +6,9 @@
 import threading
 import time
 import logging
+import functools
 import psutil
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from typing import Dict, List, Callable, Any, Optional
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
@@ -35,17 +37,28 @@ class HealthChecker(ABC):
 class SystemResourceChecker(HealthChecker):
     """系统资源检查器"""
     
-    def __init__(self, check_interval: float = 10.0):
+    def __init__(self, check_interval: float = 10.0, disk_cache_ttl: float = 60.0):
         self.check_interval = check_interval
+        self.disk_cache_ttl = disk_cache_ttl  # 磁盘使用率变化缓慢，缓存查询结果
+        self._disk_usage = None
+        self._disk_usage_time = 0.0
         self._logger = logging.getLogger(__name__)
     
+    def _get_disk_usage(self):
+        """获取磁盘使用情况（带缓存）"""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._disk_usage_time > self.disk_cache_ttl:
+            self._disk_usage = psutil.disk_usage('/')
+            self._disk_usage_time = now
+        return self._disk_usage
+    
     def check_health(self) -> HealthCheckResult:
         """检查系统资源使用情况"""
         try:
             # 获取系统资源使用情况
             cpu_percent = psutil.cpu_percent(interval=1)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            disk = self._get_disk_usage()
             
             metrics = {
                 "cpu_percent": cpu_percent,
@@ -142,14 +155,10 @@ class ThreadManagerChecker(HealthChecker):
     def check_health(self) -> HealthCheckResult:
         """检查线程管理器状态"""
         try:
-            # 获取线程信息
-            from .thread_manager import ThreadManager
-            thread_manager = ThreadManager()
-            
             # 这里简化处理，实际应该检查线程池状态
             metrics = {
                 "active_threads": threading.active_count(),
-                "managed_threads": len(thread_manager._managed_threads) if hasattr(thread_manager, '_managed_threads') else 0
+                "managed_threads": len(getattr(self._thread_manager, '_managed_threads', ()))
             }
             
             # 判断健康状态
@@ -178,60 +187,46 @@ class ThreadManagerChecker(HealthChecker):
             )
 
 class HealthMonitor:
-    """健康监控器"""
-    
-    _instance = None
-    _lock = threading.RLock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(HealthMonitor, cls).__new__(cls)
-        return cls._instance
+    """健康监控器（通过get_health_monitor获取全局实例）"""
     
     def __init__(self, check_interval: float = 10.0):
-        # 使用双重检查锁定确保单例
-        if hasattr(self, '_initialized'):
-            return
-            
-        with HealthMonitor._lock:
-            if hasattr(self, '_initialized'):
-                return
-                
-            self.check_interval = check_interval
-            self.checkers: List[HealthChecker] = []
-            self.health_status: Dict[str, HealthCheckResult] = {}
-            self.callbacks: List[Callable[[Dict[str, HealthCheckResult]], None]] = []
-            self._running = False
-            self._monitor_thread: Optional[threading.Thread] = None
-            self._logger = logging.getLogger(__name__)
-            self._signal_manager = SignalManager()
-            
-            # 添加默认的健康检查器
-            self.add_checker(SystemResourceChecker(check_interval))
-            self.add_checker(ResourceManagerChecker())
-            self.add_checker(ThreadManagerChecker())
-            
-            self._initialized = True
+        self._lock = threading.RLock()
+        self.check_interval = check_interval
+        self.checkers: List[HealthChecker] = []
+        self.health_status: Dict[str, HealthCheckResult] = {}
+        self.callbacks: List[Callable[[Dict[str, HealthCheckResult]], None]] = []
+        self._running = False
+        self._stop_event = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(__name__)
+        self._signal_manager = SignalManager()
+        # 健康检查器并发执行线程池，随监控启动创建、停止时关闭
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # 添加默认的健康检查器
+        self.add_checker(SystemResourceChecker(check_interval))
+        self.add_checker(ResourceManagerChecker())
+        self.add_checker(ThreadManagerChecker())
     
     def add_checker(self, checker: HealthChecker):
         """添加健康检查器"""
         with self._lock:
-            self.checkers.append(checker)
+            # 写时复制，读取方无需加锁
+            self.checkers = self.checkers + [checker]
             self._logger.info(f"Added health checker for component: {checker.__class__.__name__}")
     
     def remove_checker(self, checker: HealthChecker):
         """移除健康检查器"""
         with self._lock:
             if checker in self.checkers:
-                self.checkers.remove(checker)
+                self.checkers = [c for c in self.checkers if c is not checker]
                 self._logger.info(f"Removed health checker for component: {checker.__class__.__name__}")
     
     def add_callback(self, callback: Callable[[Dict[str, HealthCheckResult]], None]):
         """添加状态变化回调"""
         with self._lock:
-            self.callbacks.append(callback)
+            # 写时复制，读取方无需加锁
+            self.callbacks = self.callbacks + [callback]
     
     def start_monitoring(self):
         """开始监控"""
@@ -239,8 +234,11 @@ class HealthMonitor:
             return
         
         self._running = True
+        self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="HealthCheck")
         self._monitor_thread = threading.Thread(
             target=self._monitor_loop,
+            args=(self._executor,),
             name="HealthMonitor",
             daemon=True
         )
@@ -250,57 +248,74 @@ class HealthMonitor:
     def stop_monitoring(self):
         """停止监控"""
         self._running = False
+        self._stop_event.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5.0)
+        # 不等待卡住的检查器，避免其阻塞退出
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._logger.info("Health monitor stopped")
     
-    def _monitor_loop(self):
+    def _monitor_loop(self, executor: ThreadPoolExecutor):
         """监控循环"""
         while self._running:
             try:
                 # 执行所有健康检查
                 new_status = {}
                 
-                with self._lock:
-                    checkers = self.checkers.copy()
+                checkers = self.checkers
                 
-                for checker in checkers:
-                    try:
-                        result = checker.check_health()
-                        new_status[result.component] = result
-                    except Exception as e:
-                        # 检查器本身出错
-                        component_name = getattr(checker, '__class__', type(checker)).__name__
-                        new_status[component_name] = HealthCheckResult(
-                            component=component_name,
-                            status="error",
-                            message=f"检查器执行失败: {str(e)}"
-                        )
+                # 并发执行所有检查器，总耗时取决于最慢的检查器
+                futures = {executor.submit(checker.check_health): checker for checker in checkers}
+                try:
+                    for future in as_completed(futures, timeout=self.check_interval):
+                        try:
+                            result = future.result()
+                            new_status[result.component] = result
+                        except Exception as e:
+                            # 检查器本身出错
+                            result = self._checker_error_result(futures[future], f"检查器执行失败: {str(e)}")
+                            new_status[result.component] = result
+                except FuturesTimeoutError:
+                    for future, checker in futures.items():
+                        if not future.done():
+                            result = self._checker_error_result(checker, "检查器执行超时")
+                            new_status[result.component] = result
                 
-                # 更新状态并通知回调
+                # 更新状态
                 with self._lock:
-                    old_status = self.health_status.copy()
+                    old_status = self.health_status
                     self.health_status = new_status
+                
+                # 检查是否有状态变化，在锁外通知回调
+                if self._has_status_changed(old_status, new_status):
+                    for callback in self.callbacks:
+                        try:
+                            callback(new_status)
+                        except Exception as e:
+                            self._logger.error(f"Health monitor callback error: {e}")
                     
-                    # 检查是否有状态变化
-                    if self._has_status_changed(old_status, new_status):
-                        for callback in self.callbacks:
-                            try:
-                                callback(new_status)
-                            except Exception as e:
-                                self._logger.error(f"Health monitor callback error: {e}")
-                        
-                        # 发送系统状态更新信号
-                        self._signal_manager.emit(SignalType.SYSTEM_STATUS_UPDATED, {
-                            "type": "health_status_changed",
-                            "status": new_status
-                        })
+                    # 发送系统状态更新信号
+                    self._signal_manager.emit(SignalType.SYSTEM_STATUS_UPDATED, {
+                        "type": "health_status_changed",
+                        "status": new_status
+                    })
                 
-                time.sleep(self.check_interval)
+                self._stop_event.wait(self.check_interval)
             
             except Exception as e:
                 self._logger.error(f"Health monitor loop error: {e}")
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
+    
+    def _checker_error_result(self, checker: HealthChecker, message: str) -> HealthCheckResult:
+        """生成检查器执行异常时的检查结果"""
+        component_name = type(checker).__name__
+        return HealthCheckResult(
+            component=component_name,
+            status="error",
+            message=message
+        )
     
     def _has_status_changed(self, old_status: Dict[str, HealthCheckResult], 
                            new_status: Dict[str, HealthCheckResult]) -> bool:
@@ -344,9 +359,7 @@ class HealthMonitor:
         """检查系统是否健康"""
         return self.get_overall_status() == "healthy"
 
-# 全局健康监控器实例
-health_monitor = HealthMonitor()
-
+@functools.lru_cache(maxsize=1)
 def get_health_monitor() -> HealthMonitor:
     """获取全局健康监控器实例"""
-    return health_monitor
\ No newline at end of file
+    return HealthMonitor()
\ No newline at end of file
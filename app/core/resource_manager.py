@@ -3,17 +3,40 @@
 提供资源池、资源锁和访问控制机制
 """
 
+import sys
 import threading
 import time
 import logging
-from typing import Dict, Any, Optional, Callable, Set, List
+from typing import Dict, Any, Optional, Callable, Set, List, Tuple
 from contextlib import contextmanager
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # 导入线程管理器
-from .thread_manager import get_thread_manager
+from .thread_manager import ReadWriteLock
+
+# 每个资源保留的访问记录上限
+MAX_ACCESS_RECORDS = 1024
+
+# 资源表分片数量（必须为2的幂），不同分片的资源互不争用锁
+RESOURCE_SHARD_COUNT = 16
+
+# 线程本地缓存，保存当前线程的(标识, 名称)
+_thread_local = threading.local()
+
+def _current_thread() -> Tuple[int, str]:
+    """获取当前线程的(threading.get_ident()标识, 名称)（每个线程只查询一次）
+    
+    线程名称可能重复，持有关系以整数标识区分，名称仅用于日志和访问记录
+    """
+    tid = getattr(_thread_local, 'tid', None)
+    if tid is None:
+        tid = _thread_local.tid = (threading.get_ident(), threading.current_thread().name)
+    return tid
+
+# dataclass的slots参数需要Python 3.10+，低版本退化为普通dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class ResourceType(Enum):
     """资源类型枚举"""
@@ -27,7 +50,7 @@ class ResourceType(Enum):
     MEMORY = "memory"
     CUSTOM = "custom"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ResourceInfo:
     """资源信息"""
     resource_id: str
@@ -38,6 +61,7 @@ class ResourceInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
     max_concurrent_access: int = 1  # 最大并发访问数
     current_access_count: int = 0   # 当前访问计数
+    info_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)  # 保护访问计数等字段
 
 class AccessMode(Enum):
     """访问模式"""
@@ -67,18 +91,28 @@ class ResourceManager:
             if hasattr(self, '_initialized'):
                 return
                 
-            self._resources: Dict[str, ResourceInfo] = {}
-            self._resource_locks: Dict[str, threading.RLock] = {}
-            self._access_records: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-            self._thread_manager = get_thread_manager()
+            # 资源表按资源ID哈希分片，每个分片有独立的锁
+            self._shards: List[Tuple[threading.Lock, Dict[str, ResourceInfo]]] = [
+                (threading.Lock(), {}) for _ in range(RESOURCE_SHARD_COUNT)
+            ]
+            self._resource_locks: Dict[str, ReadWriteLock] = {}
+            # list_resources的缓存快照，仅在注册/注销后重建
+            self._resource_snapshot: Tuple[ResourceInfo, ...] = ()
+            self._snapshot_dirty = True
+            self._snapshot_lock = threading.Lock()
+            self._held_modes: Dict[Tuple[int, str], AccessMode] = {}  # (线程标识, 资源) -> 持有的访问模式
+            self._access_records: Dict[str, deque] = defaultdict(lambda: deque(maxlen=MAX_ACCESS_RECORDS))
+            # 累计访问统计，避免每次统计时遍历访问记录
+            self._total_access_time: Dict[str, float] = defaultdict(float)
+            self._access_count: Dict[str, int] = defaultdict(int)
             self._logger = logging.getLogger(__name__)
             
-            # 初始化锁
-            self._manager_lock = threading.RLock()
-            self._access_lock = threading.RLock()
-            
             self._initialized = True
     
+    def _shard(self, resource_id: str) -> Tuple[threading.Lock, Dict[str, ResourceInfo]]:
+        """获取资源ID所在的分片（锁, 资源表）"""
+        return self._shards[hash(resource_id) & (RESOURCE_SHARD_COUNT - 1)]
+    
     def register_resource(self, resource_id: str, resource_type: ResourceType, 
                          max_concurrent_access: int = 1, metadata: Dict[str, Any] = None) -> bool:
         """注册资源
@@ -92,8 +126,9 @@ class ResourceManager:
         Returns:
             bool: 注册成功返回True，否则返回False
         """
-        with self._manager_lock:
-            if resource_id in self._resources:
+        shard_lock, resources = self._shard(resource_id)
+        with shard_lock:
+            if resource_id in resources:
                 self._logger.warning(f"Resource {resource_id} already registered")
                 return False
             
@@ -108,11 +143,12 @@ class ResourceManager:
                 metadata=metadata
             )
             
-            # 创建资源锁
-            self._resource_locks[resource_id] = threading.RLock()
+            # 创建资源锁（读模式共享，写/独占模式互斥）
+            self._resource_locks[resource_id] = ReadWriteLock()
             
             # 注册资源
-            self._resources[resource_id] = resource_info
+            resources[resource_id] = resource_info
+            self._snapshot_dirty = True
             
             self._logger.info(f"Resource {resource_id} registered as {resource_type.value}")
             return True
@@ -126,25 +162,28 @@ class ResourceManager:
         Returns:
             bool: 注销成功返回True，否则返回False
         """
-        with self._manager_lock:
-            if resource_id not in self._resources:
+        shard_lock, resources = self._shard(resource_id)
+        with shard_lock:
+            if resource_id not in resources:
                 self._logger.warning(f"Resource {resource_id} not found")
                 return False
             
             # 检查是否有线程正在使用该资源
-            resource_info = self._resources[resource_id]
+            resource_info = resources[resource_id]
             if resource_info.current_access_count > 0:
                 self._logger.warning(f"Resource {resource_id} is still in use")
                 return False
             
             # 删除资源和锁
-            del self._resources[resource_id]
+            del resources[resource_id]
+            self._snapshot_dirty = True
             if resource_id in self._resource_locks:
                 del self._resource_locks[resource_id]
             
             # 清理访问记录
-            if resource_id in self._access_records:
-                del self._access_records[resource_id]
+            self._access_records.pop(resource_id, None)
+            self._total_access_time.pop(resource_id, None)
+            self._access_count.pop(resource_id, None)
             
             self._logger.info(f"Resource {resource_id} unregistered")
             return True
@@ -161,60 +200,85 @@ class ResourceManager:
         Returns:
             bool: 获取成功返回True，否则返回False
         """
-        thread_id = threading.current_thread().name
+        thread_ident, thread_id = _current_thread()
+        is_read = access_mode == AccessMode.READ
+        
+        # 无锁快速检查：非阻塞请求且资源已占满时直接返回（GIL保证读取原子性）
+        shard_lock, resources = self._shard(resource_id)
+        if timeout <= 0:
+            resource_info = resources.get(resource_id)
+            if resource_info is not None:
+                limit = resource_info.max_concurrent_access if is_read else 1
+                if resource_info.current_access_count >= limit:
+                    return False
         
         # 检查资源是否存在
-        if resource_id not in self._resources:
+        with shard_lock:
+            resource_info = resources.get(resource_id)
+            resource_lock = self._resource_locks.get(resource_id)
+        if resource_info is None or resource_lock is None:
             self._logger.error(f"Resource {resource_id} not registered")
             return False
         
-        # 使用线程管理器获取锁
-        lock_id = f"resource_{resource_id}"
-        if not self._thread_manager.acquire_lock(lock_id, timeout):
+        # 同一线程重复获取会与自身持有的锁冲突
+        held_key = (thread_ident, resource_id)
+        if held_key in self._held_modes:
+            self._logger.warning(f"Thread {thread_id} already holds resource {resource_id}")
+            return False
+        
+        # 并发上限：读访问为最大并发数，写/独占访问为1
+        limit = resource_info.max_concurrent_access if is_read else 1
+        
+        # 获取资源锁（持有至release_resource）：读模式共享，写/独占模式互斥
+        if is_read:
+            locked = resource_lock.acquire_read(timeout=timeout)
+        else:
+            locked = resource_lock.acquire_write(timeout=timeout)
+        if not locked:
             self._logger.warning(f"Failed to acquire lock for resource {resource_id}")
             return False
         
+        acquired = False
         try:
-            with self._access_lock:
-                resource_info = self._resources[resource_id]
-                
+            with resource_info.info_lock:
                 # 检查并发访问限制
-                if access_mode == AccessMode.EXCLUSIVE:
-                    # 独占访问需要没有其他访问者
-                    if resource_info.current_access_count > 0:
-                        return False
-                elif access_mode == AccessMode.WRITE:
-                    # 写访问需要没有其他写访问者
-                    if resource_info.current_access_count > 0:
-                        return False
-                else:
-                    # 读访问需要不超过最大并发数
-                    if resource_info.current_access_count >= resource_info.max_concurrent_access:
-                        return False
+                if resource_info.current_access_count >= limit:
+                    return False
                 
                 # 更新资源信息
+                now = time.monotonic()
                 resource_info.current_access_count += 1
                 resource_info.owner_thread = thread_id
-                resource_info.acquire_time = time.time()
+                resource_info.acquire_time = now
                 resource_info.usage_count += 1
                 
                 # 记录访问
                 access_record = {
                     "thread_id": thread_id,
+                    "thread_ident": thread_ident,
                     "access_mode": access_mode.value,
-                    "acquire_time": time.time(),
+                    "acquire_time": now,
                     "timeout": timeout
                 }
                 self._access_records[resource_id].append(access_record)
                 
-                self._logger.debug(f"Thread {thread_id} acquired resource {resource_id} in {access_mode.value} mode")
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug("Thread %s acquired resource %s in %s mode",
+                                       thread_id, resource_id, access_mode.value)
+                self._held_modes[held_key] = access_mode
+                acquired = True
                 return True
                 
         except Exception as e:
             self._logger.error(f"Error acquiring resource {resource_id}: {e}")
-            # 确保释放锁
-            self._thread_manager.release_lock(lock_id)
             return False
+        finally:
+            # 获取失败时确保释放锁
+            if not acquired:
+                if is_read:
+                    resource_lock.release_read()
+                else:
+                    resource_lock.release_write()
     
     def release_resource(self, resource_id: str) -> bool:
         """释放资源访问权限
@@ -225,22 +289,25 @@ class ResourceManager:
         Returns:
             bool: 释放成功返回True，否则返回False
         """
-        thread_id = threading.current_thread().name
-        lock_id = f"resource_{resource_id}"
+        thread_ident, thread_id = _current_thread()
+        
+        shard_lock, resources = self._shard(resource_id)
         
         try:
-            with self._access_lock:
-                if resource_id not in self._resources:
-                    self._logger.error(f"Resource {resource_id} not registered")
-                    return False
-                
-                resource_info = self._resources[resource_id]
-                
-                # 检查是否是当前线程持有资源
-                if resource_info.owner_thread != thread_id:
-                    self._logger.warning(f"Thread {thread_id} trying to release resource {resource_id} not owned by it")
-                    return False
-                
+            with shard_lock:
+                resource_info = resources.get(resource_id)
+                resource_lock = self._resource_locks.get(resource_id)
+            if resource_info is None or resource_lock is None:
+                self._logger.error(f"Resource {resource_id} not registered")
+                return False
+            
+            # 检查是否是当前线程持有资源
+            access_mode = self._held_modes.pop((thread_ident, resource_id), None)
+            if access_mode is None:
+                self._logger.warning(f"Thread {thread_id} trying to release resource {resource_id} not owned by it")
+                return False
+            
+            with resource_info.info_lock:
                 # 更新资源信息
                 resource_info.current_access_count -= 1
                 if resource_info.current_access_count <= 0:
@@ -248,21 +315,28 @@ class ResourceManager:
                     resource_info.owner_thread = None
                     resource_info.acquire_time = None
                 
-                # 更新访问记录
-                if self._access_records[resource_id]:
-                    last_record = self._access_records[resource_id][-1]
-                    last_record["release_time"] = time.time()
-                    last_record["duration"] = last_record["release_time"] - last_record["acquire_time"]
+                # 更新当前线程最近一次的访问记录
+                now = time.monotonic()
+                for record in reversed(self._access_records[resource_id]):
+                    if record["thread_ident"] == thread_ident and "release_time" not in record:
+                        record["release_time"] = now
+                        record["duration"] = now - record["acquire_time"]
+                        self._total_access_time[resource_id] += record["duration"]
+                        self._access_count[resource_id] += 1
+                        break
                 
-                self._logger.debug(f"Thread {thread_id} released resource {resource_id}")
-                return True
+            # 释放资源锁
+            if access_mode == AccessMode.READ:
+                resource_lock.release_read()
+            else:
+                resource_lock.release_write()
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Thread %s released resource %s", thread_id, resource_id)
+            return True
                 
         except Exception as e:
             self._logger.error(f"Error releasing resource {resource_id}: {e}")
             return False
-        finally:
-            # 释放锁
-            self._thread_manager.release_lock(lock_id)
     
     @contextmanager
     def managed_resource(self, resource_id: str, access_mode: AccessMode = AccessMode.EXCLUSIVE, 
@@ -279,7 +353,7 @@ class ResourceManager:
             raise RuntimeError(f"Failed to acquire resource {resource_id}")
         
         try:
-            yield self._resources[resource_id]
+            yield self.get_resource_info(resource_id)
         finally:
             self.release_resource(resource_id)
     
@@ -292,17 +366,30 @@ class ResourceManager:
         Returns:
             ResourceInfo: 资源信息，如果资源不存在返回None
         """
-        with self._manager_lock:
-            return self._resources.get(resource_id)
+        shard_lock, resources = self._shard(resource_id)
+        with shard_lock:
+            return resources.get(resource_id)
     
-    def list_resources(self) -> List[ResourceInfo]:
+    def list_resources(self) -> Tuple[ResourceInfo, ...]:
         """列出所有资源
         
         Returns:
-            List[ResourceInfo]: 资源信息列表
+            Tuple[ResourceInfo, ...]: 资源信息快照（资源注册/注销前复用同一快照）
         """
-        with self._manager_lock:
-            return list(self._resources.values())
+        if not self._snapshot_dirty:
+            return self._resource_snapshot
+        
+        with self._snapshot_lock:
+            if self._snapshot_dirty:
+                # 先清除标记，重建期间的注册/注销会再次置位
+                self._snapshot_dirty = False
+                result: List[ResourceInfo] = []
+                # 逐个分片获取快照，无需全局锁
+                for shard_lock, resources in self._shards:
+                    with shard_lock:
+                        result.extend(resources.values())
+                self._resource_snapshot = tuple(result)
+            return self._resource_snapshot
     
     def get_access_records(self, resource_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """获取资源访问记录
@@ -314,9 +401,10 @@ class ResourceManager:
         Returns:
             List[Dict[str, Any]]: 访问记录列表
         """
-        with self._manager_lock:
-            records = self._access_records.get(resource_id, [])
-            return records[-limit:] if len(records) > limit else records
+        shard_lock, _ = self._shard(resource_id)
+        with shard_lock:
+            records = self._access_records.get(resource_id, ())
+            return list(records)[-limit:]
     
     def is_resource_available(self, resource_id: str) -> bool:
         """检查资源是否可用
@@ -327,12 +415,11 @@ class ResourceManager:
         Returns:
             bool: 资源可用返回True，否则返回False
         """
-        with self._manager_lock:
-            if resource_id not in self._resources:
-                return False
-            
-            resource_info = self._resources[resource_id]
-            return resource_info.current_access_count == 0
+        # 只读取单个整数，无需加锁（GIL保证读取原子性）
+        resource_info = self._shard(resource_id)[1].get(resource_id)
+        if resource_info is None:
+            return False
+        return resource_info.current_access_count == 0
     
     def get_resource_usage_stats(self, resource_id: str) -> Dict[str, Any]:
         """获取资源使用统计信息
@@ -343,19 +430,15 @@ class ResourceManager:
         Returns:
             Dict[str, Any]: 使用统计信息
         """
-        with self._manager_lock:
-            if resource_id not in self._resources:
+        shard_lock, resources = self._shard(resource_id)
+        with shard_lock:
+            if resource_id not in resources:
                 return {}
             
-            resource_info = self._resources[resource_id]
-            records = self._access_records.get(resource_id, [])
-            
-            total_access_time = 0.0
-            access_count = 0
-            for record in records:
-                if "duration" in record:
-                    total_access_time += record["duration"]
-                    access_count += 1
+            resource_info = resources[resource_id]
+            records = self._access_records.get(resource_id, ())
+            total_access_time = self._total_access_time.get(resource_id, 0.0)
+            access_count = self._access_count.get(resource_id, 0)
             
             avg_access_time = total_access_time / access_count if access_count > 0 else 0.0
             
@@ -1,11 +1,13 @@
 """
 信号管理器 - 实现基于信号的松耦合通信机制
 """
+import sys
 import threading
 import weakref
 import logging
 from enum import Enum
-from typing import Dict, List, Callable, Any, Optional
+from collections import defaultdict
+from typing import Dict, List, Set, Callable, Any, Optional, Hashable
 import time
 
 class SignalType(Enum):
@@ -49,6 +51,18 @@ class SignalType(Enum):
     FILE_TRANSFER_COMPLETED = "file_transfer_completed"
     FILE_TRANSFER_FAILED = "file_transfer_failed"
 
+def _handler_key(handler: Callable) -> Hashable:
+    """生成处理器的唯一标识（绑定方法每次访问都会生成新对象，需按实例和函数区分）"""
+    if hasattr(handler, '__self__') and hasattr(handler, '__func__'):
+        return (id(handler.__self__), id(handler.__func__))
+    return id(handler)
+
+def _make_weak_handler(handler: Callable) -> weakref.ref:
+    """为处理器创建弱引用，绑定方法使用WeakMethod"""
+    if hasattr(handler, '__self__') and hasattr(handler, '__func__'):
+        return weakref.WeakMethod(handler)
+    return weakref.ref(handler)
+
 class SignalManager:
     """信号管理器 - 实现观察者模式的事件系统"""
     
@@ -71,13 +85,16 @@ class SignalManager:
             if hasattr(self, '_initialized'):
                 return
                 
-            self._handlers: Dict[SignalType, List[weakref.WeakMethod]] = {}
+            # 按需创建各信号类型的处理器表
+            self._handlers: Dict[SignalType, Dict[Hashable, weakref.ref]] = defaultdict(dict)
+            self._nonempty: Set[SignalType] = set()  # 存在处理器的信号类型，emit时无锁检查
+            # 处理器变更代数，emit按代数复用线程本地的处理器快照
+            self._generation: Dict[SignalType, int] = defaultdict(int)
+            self._snapshot_cache = threading.local()
             self._logger = logging.getLogger(__name__)
+            # 预先缓存信号名称，日志中无需每次访问枚举值
+            self._signal_names: Dict[SignalType, str] = {st: sys.intern(st.value) for st in SignalType}
             
-            # 初始化所有信号类型的处理器列表
-            for signal_type in SignalType:
-                self._handlers[signal_type] = []
-                
             self._initialized = True
     
     def connect(self, signal_type: SignalType, handler: Callable[[Any], None]):
@@ -90,9 +107,10 @@ class SignalManager:
         """
         with self._lock:
             # 使用弱引用避免循环引用
-            weak_handler = weakref.WeakMethod(handler)
-            self._handlers[signal_type].append(weak_handler)
-            self._logger.debug(f"Connected handler to signal: {signal_type.value}")
+            self._handlers[signal_type][_handler_key(handler)] = _make_weak_handler(handler)
+            self._nonempty.add(signal_type)
+            self._generation[signal_type] += 1
+            self._logger.debug("Connected handler to signal: %s", self._signal_names[signal_type])
     
     def disconnect(self, signal_type: SignalType, handler: Callable[[Any], None]):
         """
@@ -103,13 +121,12 @@ class SignalManager:
             handler: 处理函数
         """
         with self._lock:
-            handlers = self._handlers[signal_type]
             # 移除匹配的处理器
-            self._handlers[signal_type] = [
-                h for h in handlers 
-                if h() is not None and h() != handler
-            ]
-            self._logger.debug(f"Disconnected handler from signal: {signal_type.value}")
+            self._handlers[signal_type].pop(_handler_key(handler), None)
+            if not self._handlers[signal_type]:
+                self._nonempty.discard(signal_type)
+            self._generation[signal_type] += 1
+            self._logger.debug("Disconnected handler from signal: %s", self._signal_names[signal_type])
     
     def emit(self, signal_type: SignalType, data: Any = None):
         """
@@ -119,26 +136,55 @@ class SignalManager:
             signal_type: 信号类型
             data: 信号数据
         """
-        with self._lock:
-            handlers = self._handlers[signal_type][:]
-            
+        # 无处理器时直接返回，避免加锁和复制列表
+        if signal_type not in self._nonempty:
+            return
+        
+        handlers = self._get_handler_snapshot(signal_type)
+        
         # 在锁外执行处理器，避免死锁
         executed_count = 0
-        for weak_handler in handlers:
+        dead_handlers = []
+        for key, weak_handler in handlers:
             handler = weak_handler()
             if handler is not None:
                 try:
                     handler(data)
                     executed_count += 1
                 except Exception as e:
-                    self._logger.error(f"Signal handler error for {signal_type.value}: {e}")
+                    self._logger.error("Signal handler error for %s: %s", self._signal_names[signal_type], e)
             else:
-                # 清理失效的弱引用
-                with self._lock:
-                    if weak_handler in self._handlers[signal_type]:
-                        self._handlers[signal_type].remove(weak_handler)
+                dead_handlers.append((key, weak_handler))
+        
+        # 批量清理失效的弱引用，只加锁一次
+        if dead_handlers:
+            with self._lock:
+                handlers_map = self._handlers[signal_type]
+                for key, weak_handler in dead_handlers:
+                    if handlers_map.get(key) is weak_handler:
+                        del handlers_map[key]
+                self._generation[signal_type] += 1
+                if not handlers_map:
+                    self._nonempty.discard(signal_type)
         
-        self._logger.debug(f"Emitted signal {signal_type.value} to {executed_count} handlers")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Emitted signal %s to %d handlers", self._signal_names[signal_type], executed_count)
+    
+    def _get_handler_snapshot(self, signal_type: SignalType) -> tuple:
+        """获取处理器快照，处理器未变更时复用当前线程缓存的快照"""
+        snapshots = getattr(self._snapshot_cache, 'snapshots', None)
+        if snapshots is None:
+            snapshots = self._snapshot_cache.snapshots = {}
+        
+        cached = snapshots.get(signal_type)
+        if cached is not None and cached[0] == self._generation[signal_type]:
+            return cached[1]
+        
+        with self._lock:
+            generation = self._generation[signal_type]
+            handlers = tuple(self._handlers[signal_type].items())
+        snapshots[signal_type] = (generation, handlers)
+        return handlers
 
 class SignalMixin:
     """信号混入类，为其他类提供信号功能"""
@@ -5,15 +5,58 @@
 import numpy as np
 import threading
 import logging
+import math
 import time
-import random
-from typing import List, Optional, Dict, Any, Union, Callable
+from typing import List, Optional, Dict, Any, Union, Callable, Sequence, Tuple
 
 from .base_control import BaseRobotControl
 from ...config.constants import RobotState, MotionPrimitive
 from ...config.settings import ROBOT_CONFIG
 from flexiv_control.utils.core.signal_manager import get_signal_manager, SignalType, SignalData
 
+# Numba导入（可选，用于编译模拟循环的单步计算）
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    pass
+
+# 模拟循环周期 (秒)，对应50Hz
+SIMULATION_PERIOD = 0.02
+
+# 关节限位 (弧度)，形状(7, 2)，每行为[最小值, 最大值]，所有实例共享只读
+_JOINT_LIMITS = np.array([
+    [-math.pi, math.pi],                       # Joint 1: ±180°
+    [-math.pi/2, math.pi/2],                   # Joint 2: ±90°
+    [-170*math.pi/180, 170*math.pi/180],       # Joint 3: ±170°
+    [-math.pi, math.pi],                       # Joint 4: ±180°
+    [-120*math.pi/180, 120*math.pi/180],       # Joint 5: ±120°
+    [-2*math.pi, 2*math.pi],                   # Joint 6: ±360°
+    [-math.pi, math.pi]                        # Joint 7: ±180°
+])
+_JOINT_LIMITS.flags.writeable = False
+
+
+def _tick_kernel(angles, start, delta, target, velocities, move_velocities, torques,
+                 tcp_pose, tcp_weights, tcp_base, progress):
+    """模拟循环单步计算，原地更新关节角度、速度、力矩和TCP位置
+    输入: 各状态数组及插值进度progress(0~1)
+    输出: 无返回值
+    """
+    # 线性插值: angles = start + delta * progress
+    angles[:] = start + delta * progress
+    # 匀速插值的速度为常量
+    velocities[:] = move_velocities
+    # 模拟力矩 (与位置误差成正比, 刚度系数10.0)
+    torques[:] = (target - angles) * 10.0
+    # TCP位置简化线性模型: position = base + W @ angles，姿态保持初始的单位四元数
+    tcp_pose[:3] = tcp_base + (tcp_weights * angles).sum(axis=1)
+
+
+if NUMBA_AVAILABLE:
+    _tick_kernel = njit(cache=True, fastmath=True)(_tick_kernel)
+
 
 class SimulatorRobotControl(BaseRobotControl):
     """模拟机器人控制实现类"""
@@ -27,27 +70,35 @@ class SimulatorRobotControl(BaseRobotControl):
         
         # 信号管理器
         self._signal_manager = get_signal_manager()
+        self._last_signal: Optional[Tuple[SignalType, str]] = None  # 最近一次发射的(信号类型, 文本消息)，用于去重
         
         # 线程安全控制
         self._running = False
         self._simulation_thread = None
-        self._robot_lock = threading.RLock()  # 机器人状态保护锁
-        self._state_lock = threading.RLock()  # 状态变量保护锁
-        self._simulation_lock = threading.RLock()  # 模拟线程保护锁
         
         # 模拟状态变量
         self._current_mode = "IDLE"
         
-        # 初始关节角度 (弧度)
-        self.joint_angles = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        self.joint_velocities = [0.0] * 7
-        self.joint_torques = [0.0] * 7
+        # 关节状态 (弧度, 弧度/秒, Nm)，使用NumPy数组整体运算
+        self._joint_angles = np.zeros(7)
+        self._joint_velocities = np.zeros(7)
+        self._joint_torques = np.zeros(7)
+        self._rng = np.random.default_rng()
         
         # TCP位姿 [x, y, z, qw, qx, qy, qz]
-        self.tcp_pose = [0.5, 0.0, 0.5, 1.0, 0.0, 0.0, 0.0]
+        self._tcp_pose = np.array([0.5, 0.0, 0.5, 1.0, 0.0, 0.0, 0.0])
+        
+        # TCP位置简化模型: position = base + W @ joint_angles
+        self._tcp_base = np.array([0.5, 0.0, 0.5])
+        self._tcp_weights = np.array([
+            [0.1, 0.1, 0.1, 0.0, 0.0, 0.0, 0.0],     # x: 关节1-3
+            [0.0, 0.0, 0.0, 0.05, 0.05, 0.05, 0.0],  # y: 关节4-6
+            [0.0, 0.08, 0.08, 0.08, 0.0, 0.0, 0.0]   # z: 关节2-4
+        ])
         
         # 力/力矩传感器数据
-        self.ft_sensor_data = [0.0] * 6
+        self._ft_sensor_data = np.zeros(6)
+        self._ft_amplitudes = np.array([5.0, 3.0, 10.0, 1.0, 1.0, 0.5])  # Fx, Fy, Fz, Tx, Ty, Tz 噪声幅值
         
         # 错误处理状态
         self._last_error = None
@@ -62,26 +113,63 @@ class SimulatorRobotControl(BaseRobotControl):
             'recovery_timeout': 10.0
         }
         
-        # 关节限位设置
-        import math
-        self.joint_limits = [
-            (-math.pi, math.pi),           # Joint 1: ±180° -> ±π rad
-            (-math.pi/2, math.pi/2),       # Joint 2: ±90° -> ±π/2 rad
-            (-170*math.pi/180, 170*math.pi/180),  # Joint 3: ±170° -> ±170π/180 rad
-            (-math.pi, math.pi),           # Joint 4: ±180° -> ±π rad
-            (-120*math.pi/180, 120*math.pi/180),  # Joint 5: ±120° -> ±120π/180 rad
-            (-2*math.pi, 2*math.pi),       # Joint 6: ±360° -> ±2π rad
-            (-math.pi, math.pi)            # Joint 7: ±180° -> ±π rad
-        ]
+        # 关节限位设置 (共享模块级只读数组)
+        self.joint_limits = _JOINT_LIMITS
+        self._joint_min = _JOINT_LIMITS[:, 0]
+        self._joint_max = _JOINT_LIMITS[:, 1]
         
         # 运动参数
         self._movement_speed = 0.05  # 弧度/秒
         self._is_moving = False
-        self._target_positions = None
+        self._target_positions = np.zeros(7)
+        self._start_angles = np.zeros(7)  # 运动起点
+        self._delta = np.zeros(7)  # 目标与起点之差
+        self._move_velocities = np.zeros(7)  # 匀速插值对应的关节速度
         self._movement_start_time = 0
         
         self._logger.info(f"模拟机器人控制器已初始化: {robot_id}")
 
+    @property
+    def joint_angles(self) -> List[float]:
+        """关节角度列表(弧度制)"""
+        return self._joint_angles.tolist()
+
+    @joint_angles.setter
+    def joint_angles(self, value: List[float]):
+        self._joint_angles[:] = value
+
+    @property
+    def joint_velocities(self) -> List[float]:
+        """关节速度列表(弧度/秒)"""
+        return self._joint_velocities.tolist()
+
+    @joint_velocities.setter
+    def joint_velocities(self, value: List[float]):
+        self._joint_velocities[:] = value
+
+    @property
+    def joint_torques(self) -> List[float]:
+        """关节力矩列表(Nm)"""
+        return self._joint_torques.tolist()
+
+    @joint_torques.setter
+    def joint_torques(self, value: List[float]):
+        self._joint_torques[:] = value
+
+    @property
+    def ft_sensor_data(self) -> List[float]:
+        """力/力矩传感器数据[Fx, Fy, Fz, Tx, Ty, Tz]"""
+        return self._ft_sensor_data.tolist()
+
+    @property
+    def tcp_pose(self) -> List[float]:
+        """TCP位姿列表[x, y, z, qw, qx, qy, qz]"""
+        return self._tcp_pose.tolist()
+
+    @tcp_pose.setter
+    def tcp_pose(self, value: List[float]):
+        self._tcp_pose[:] = value
+
     def connect(self) -> bool:
         """连接模拟机器人
         输出: 总是返回True
@@ -126,31 +214,31 @@ class SimulatorRobotControl(BaseRobotControl):
         """
         return self._state
 
-    def get_joint_positions(self) -> List[float]:
+    def get_joint_positions(self) -> np.ndarray:
         """获取关节位置
-        输出: 7个关节的角度列表(弧度制)
+        输出: 形状为(7,)的关节角度数组副本(弧度制)，需要列表时调用.tolist()
         """
-        return self.joint_angles.copy()
+        return self._joint_angles.copy()
 
-    def get_joint_velocities(self) -> List[float]:
+    def get_joint_velocities(self) -> np.ndarray:
         """获取关节速度
-        输出: 7个关节的速度列表(弧度/秒)
+        输出: 形状为(7,)的关节速度数组副本(弧度/秒)
         """
-        return self.joint_velocities.copy()
+        return self._joint_velocities.copy()
 
-    def get_joint_torques(self) -> List[float]:
+    def get_joint_torques(self) -> np.ndarray:
         """获取关节力矩
-        输出: 7个关节的力矩列表(Nm)
+        输出: 形状为(7,)的关节力矩数组副本(Nm)
         """
-        return self.joint_torques.copy()
+        return self._joint_torques.copy()
 
-    def get_tcp_pose(self) -> List[float]:
+    def get_tcp_pose(self) -> np.ndarray:
         """获取TCP位姿
-        输出: TCP位姿列表[x, y, z, qw, qx, qy, qz]
+        输出: 形状为(7,)的TCP位姿数组副本[x, y, z, qw, qx, qy, qz]
         """
-        return self.tcp_pose.copy()
+        return self._tcp_pose.copy()
 
-    def move_joint(self, target_positions: List[float], 
+    def move_joint(self, target_positions: Union[Sequence[float], np.ndarray], 
                   speed: float = 1.0, 
                   primitive: MotionPrimitive = MotionPrimitive.JOINT_MOVE) -> bool:
         """关节运动
@@ -162,15 +250,21 @@ class SimulatorRobotControl(BaseRobotControl):
             return False
         
         # 检查关节限位
-        for i, (angle, (min_limit, max_limit)) in enumerate(zip(target_positions, self.joint_limits)):
-            if not (min_limit <= angle <= max_limit):
-                self._logger.error(f"关节{i+1}角度超出限位: {angle:.3f} rad")
-                return False
+        target = np.asarray(target_positions, dtype=np.float64)
+        out_of_range = (target < self._joint_min) | (target > self._joint_max)
+        if out_of_range.any():
+            i = int(np.argmax(out_of_range))
+            self._logger.error(f"关节{i+1}角度超出限位: {target[i]:.3f} rad")
+            return False
         
-        self._target_positions = target_positions
+        self._target_positions = target
         self._movement_speed = 0.05 * speed
+        # 缓存插值起点和增量，模拟循环中按进度线性插值
+        self._start_angles = self._joint_angles.copy()
+        self._delta = target - self._start_angles
+        self._move_velocities = self._delta * self._movement_speed
         self._is_moving = True
-        self._movement_start_time = time.time()
+        self._movement_start_time = time.monotonic()
         self._current_mode = "EXECUTING"
         
         self._logger.info(f"开始关节运动到目标位置")
@@ -186,12 +280,8 @@ class SimulatorRobotControl(BaseRobotControl):
         # 模拟实现 - 转换为关节运动
         self._logger.info("模拟模式: 直线运动转换为关节运动执行")
         
-        # 生成一个合理的关节目标位置
-        target_joints = []
-        for i, current_angle in enumerate(self.joint_angles):
-            # 在当前位置基础上添加小范围变化
-            variation = random.uniform(-0.2, 0.2)
-            target_joints.append(current_angle + variation)
+        # 生成一个合理的关节目标位置: 在当前位置基础上添加小范围变化
+        target_joints = self._joint_angles + self._rng.uniform(-0.2, 0.2, 7)
         
         return self.move_joint(target_joints, speed, primitive)
 
@@ -200,7 +290,6 @@ class SimulatorRobotControl(BaseRobotControl):
         输出: 停止成功返回True
         """
         self._is_moving = False
-        self._target_positions = None
         self._current_mode = "IDLE"
         self._logger.info("运动已停止")
         return True
@@ -236,33 +325,22 @@ class SimulatorRobotControl(BaseRobotControl):
 
     def _simulation_loop(self):
         """模拟循环 - 更新机器人状态和运动"""
+        # 按固定截止时间调度，避免每周期工作耗时累积造成频率漂移
+        next_tick = time.monotonic()
         while self._running:
-           try:
+            try:
                 # 处理运动
-                if self._is_moving and self._target_positions:
-                    current_time = time.time()
-                    elapsed = current_time - self._movement_start_time
+                if self._is_moving:
+                    elapsed = time.monotonic() - self._movement_start_time
                     
                     # 计算插值位置
                     progress = min(1.0, elapsed * self._movement_speed)
                     
-                    for i in range(7):
-                        start_angle = self.joint_angles[i]
-                        target_angle = self._target_positions[i]
-                        
-                        # 线性插值
-                        self.joint_angles[i] = start_angle + (target_angle - start_angle) * progress
-                        
-                        # 计算模拟速度 (导数)
-                        if elapsed > 0:
-                            self.joint_velocities[i] = (target_angle - start_angle) * self._movement_speed
-                        
-                        # 计算模拟力矩 (与位置误差成正比)
-                        error = target_angle - self.joint_angles[i]
-                        self.joint_torques[i] = error * 10.0  # 刚度系数
-                    
-                    # 更新TCP位姿 (简单模拟)
-                    self._update_tcp_pose()
+                    # 插值位置、速度、力矩和TCP位姿 (有Numba时为编译后的内核)
+                    _tick_kernel(self._joint_angles, self._start_angles, self._delta,
+                                 self._target_positions, self._joint_velocities,
+                                 self._move_velocities, self._joint_torques, self._tcp_pose,
+                                 self._tcp_weights, self._tcp_base, progress)
                     
                     # 更新力/力矩传感器数据
                     self._update_ft_sensor()
@@ -279,44 +357,54 @@ class SimulatorRobotControl(BaseRobotControl):
                 # 模拟一些状态变化
                 self._simulate_random_changes()
                 
-                time.sleep(0.02)  # 50Hz更新频率
+                # 50Hz更新频率，超时则重新对齐截止时间
+                next_tick += SIMULATION_PERIOD
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    next_tick = time.monotonic()
                 
             except Exception as e:
                 self._logger.warning(f"模拟循环错误: {e}")
                 time.sleep(0.1)
+                next_tick = time.monotonic()
 
-    def _update_tcp_pose(self):
-        """更新TCP位姿 (简单模拟)"""
-        # 基于关节角度计算TCP位姿的简化模型
-        # 这里使用一个简单的线性关系进行模拟
-        base_x = 0.5
-        base_z = 0.5
-        
-        # TCP位置与关节角度相关
-        self.tcp_pose[0] = base_x + sum(angle * 0.1 for angle in self.joint_angles[:3])
-        self.tcp_pose[1] = sum(angle * 0.05 for angle in self.joint_angles[3:6])
-        self.tcp_pose[2] = base_z + sum(angle * 0.08 for angle in self.joint_angles[1:4])
+    def _emit_signal(self, signal_type: SignalType, data: Any) -> bool:
+        """发射信号，与上一次相同的文本消息不重复发射
+        输入: signal_type - 信号类型, data - 信号数据
+        输出: 发射成功返回True, 被去重或失败返回False
+        """
+        if isinstance(data, str):
+            key = (signal_type, data)
+            if key == self._last_signal:
+                return False
+            self._last_signal = key
+        else:
+            self._last_signal = None
         
-        # 保持四元数单位化
-        self.tcp_pose[3:] = [1.0, 0.0, 0.0, 0.0]  # 单位四元数
+        try:
+            signal_data = SignalData(
+                signal_type=signal_type,
+                source=self.robot_id,
+                timestamp=time.time(),
+                data=data,
+                metadata={"source": self.robot_id, "class": "SimulatorRobotControl"}
+            )
+            return self._signal_manager.emit_signal(signal_data)
+        except Exception as e:
+            self._logger.error("信号发射失败: %s", e)
+            return False
 
     def _update_ft_sensor(self):
         """更新力/力矩传感器数据"""
-        # 模拟一些力/力矩数据
-        self.ft_sensor_data = [
-            random.uniform(-5.0, 5.0),   # Fx
-            random.uniform(-3.0, 3.0),   # Fy
-            random.uniform(-10.0, 10.0), # Fz
-            random.uniform(-1.0, 1.0),   # Tx
-            random.uniform(-1.0, 1.0),   # Ty
-            random.uniform(-0.5, 0.5)    # Tz
-        ]
+        # 模拟一些力/力矩数据，一次采样全部6个分量
+        np.multiply(self._rng.uniform(-1.0, 1.0, 6), self._ft_amplitudes, out=self._ft_sensor_data)
 
     def _simulate_random_changes(self):
         """模拟随机状态变化"""
         # 小范围随机扰动
         if not self._is_moving:
-            for i in range(7):
-                self.joint_angles[i] += random.uniform(-0.001, 0.001)
-                self.joint_velocities[i] = random.uniform(-0.01, 0.01)
-                self.joint_torques[i] = random.uniform(-0.1, 0.1)
\ No newline at end of file
+            self._joint_angles += self._rng.uniform(-0.001, 0.001, 7)
+            self._joint_velocities[:] = self._rng.uniform(-0.01, 0.01, 7)
+            self._joint_torques[:] = self._rng.uniform(-0.1, 0.1, 7)
\ No newline at end of file
@@ -3,16 +3,23 @@
 实现线程协调、死锁预防和资源管理
 """
 
+import os
+import itertools
 import threading
-import queue
 import time
 import logging
 from typing import Dict, Set, Optional, Callable, Any
 from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
 
+# 未取回任务结果的保留上限，超出后丢弃最早的结果
+MAX_TASK_RESULTS = 10_000
+
+# 工作线程栈大小 (字节)，任务函数很少需要默认的8MB栈
+WORKER_STACK_SIZE = 256 * 1024
+
 class TaskPriority(Enum):
     """任务优先级"""
     LOW = 1
@@ -35,41 +42,70 @@ class DeadlockDetector:
     """死锁检测器"""
     
     def __init__(self):
-        self._lock_graph: Dict[str, Set[str]] = defaultdict(set)
-        self._thread_locks: Dict[str, Set[str]] = defaultdict(set)
-        self._lock_owners: Dict[str, str] = {}
-        self._detection_lock = threading.RLock()
+        # 线程以threading.get_ident()的整数标识作为键
+        self._waits_for: Dict[int, Set[int]] = defaultdict(set)  # 等待图: 线程 -> 其所等待锁的持有者
+        self._lock_waiters: Dict[str, Set[int]] = defaultdict(set)  # 锁 -> 等待该锁的线程
+        self._thread_locks: Dict[int, Set[str]] = defaultdict(set)
+        self._lock_owners: Dict[str, int] = {}
+        # 各方法之间不会重入，使用普通Lock
+        self._detection_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
     
-    def register_lock_request(self, thread_id: str, lock_id: str) -> bool:
+    def register_lock_request(self, thread_id: int, lock_id: str) -> bool:
         """注册锁请求，检测潜在死锁"""
+        # 快速路径：锁无持有者时不可能形成循环，也无需记录等待关系
+        if lock_id not in self._lock_owners:
+            return True
+        
         with self._detection_lock:
             # 检查是否会形成循环依赖
             if self._would_create_cycle(thread_id, lock_id):
                 self._logger.warning(f"Deadlock detected: thread {thread_id} requesting lock {lock_id}")
                 return False  # 拒绝锁请求以避免死锁
             
-            # 记录锁请求
-            self._lock_graph[thread_id].add(lock_id)
+            # 记录等待边: 请求线程 -> 锁持有者
+            owner = self._lock_owners.get(lock_id)
+            if owner is not None and owner != thread_id:
+                self._waits_for[thread_id].add(owner)
+                self._lock_waiters[lock_id].add(thread_id)
             return True
     
-    def register_lock_acquired(self, thread_id: str, lock_id: str):
+    def register_lock_acquired(self, thread_id: int, lock_id: str):
         """注册锁获取"""
         with self._detection_lock:
             self._thread_locks[thread_id].add(lock_id)
             self._lock_owners[lock_id] = thread_id
-            # 清理锁请求记录
-            self._lock_graph[thread_id].discard(lock_id)
+            # 清理锁请求记录（快速路径下未记录请求）
+            self._clear_request(thread_id, lock_id)
+            # 其余等待者改为等待新的持有者
+            for waiter in self._lock_waiters.get(lock_id, ()):
+                self._waits_for[waiter] = {thread_id}
     
-    def register_lock_released(self, thread_id: str, lock_id: str):
-        """注册锁释放"""
+    def register_lock_released(self, thread_id: int, lock_id: str):
+        """注册锁释放（也用于清理超时或失败的锁请求）"""
         with self._detection_lock:
-            self._thread_locks[thread_id].discard(lock_id)
-            if lock_id in self._lock_owners:
+            held = self._thread_locks.get(thread_id)
+            if held is not None:
+                held.discard(lock_id)
+                if not held:
+                    del self._thread_locks[thread_id]
+            if self._lock_owners.get(lock_id) == thread_id:
                 del self._lock_owners[lock_id]
-            self._lock_graph[thread_id].discard(lock_id)
+                for waiter in self._lock_waiters.get(lock_id, ()):
+                    self._waits_for[waiter].discard(thread_id)
+            self._clear_request(thread_id, lock_id)
     
-    def _would_create_cycle(self, thread_id: str, lock_id: str) -> bool:
+    def _clear_request(self, thread_id: int, lock_id: str):
+        """移除线程对锁的等待记录（调用方需持有_detection_lock）"""
+        waiters = self._lock_waiters.get(lock_id)
+        if waiters and thread_id in waiters:
+            waiters.discard(thread_id)
+            if not waiters:
+                del self._lock_waiters[lock_id]
+            # 线程同一时刻只阻塞在一个锁上
+            self._waits_for.pop(thread_id, None)
+    
+    def _would_create_cycle(self, thread_id: int, lock_id: str) -> bool:
         """检查是否会创建循环依赖"""
         # 如果锁已被其他线程持有
         if lock_id in self._lock_owners:
@@ -79,8 +115,8 @@ class DeadlockDetector:
                 return self._has_path(owner_thread, thread_id)
         return False
     
-    def _has_path(self, from_thread: str, to_thread: str) -> bool:
-        """检查是否存在从from_thread到to_thread的路径"""
+    def _has_path(self, from_thread: int, to_thread: int) -> bool:
+        """检查等待图中是否存在从from_thread到to_thread的路径"""
         visited = set()
         stack = [from_thread]
         
@@ -93,15 +129,77 @@ class DeadlockDetector:
                 continue
             visited.add(current)
             
-            # 添加当前线程等待的锁的所有者
-            for lock_id in self._lock_graph[current]:
-                if lock_id in self._lock_owners:
-                    owner = self._lock_owners[lock_id]
-                    if owner not in visited:
-                        stack.append(owner)
+            # 添加当前线程所等待的线程
+            for owner in self._waits_for.get(current, ()):
+                if owner not in visited:
+                    stack.append(owner)
         
         return False
 
+class ReadWriteLock:
+    """读写锁 - 允许多个读者并发访问，写者独占访问（写者优先）"""
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+    
+    def acquire_read(self, timeout: Optional[float] = None) -> bool:
+        """获取读锁，超时返回False"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: not self._writer and self._waiting_writers == 0, timeout):
+                return False
+            self._readers += 1
+            return True
+    
+    def release_read(self):
+        """释放读锁"""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+    
+    def acquire_write(self, timeout: Optional[float] = None) -> bool:
+        """获取写锁，超时返回False"""
+        with self._cond:
+            self._waiting_writers += 1
+            acquired = False
+            try:
+                acquired = self._cond.wait_for(lambda: not self._writer and self._readers == 0, timeout)
+                if acquired:
+                    self._writer = True
+                return acquired
+            finally:
+                self._waiting_writers -= 1
+                if not acquired:
+                    # 唤醒因等待写者而阻塞的读者
+                    self._cond.notify_all()
+    
+    def release_write(self):
+        """释放写锁"""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+    
+    @contextmanager
+    def read_locked(self):
+        """上下文管理器形式的读锁"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write_locked(self):
+        """上下文管理器形式的写锁"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
 class TimeoutLockManager:
     """带超时机制的锁管理器"""
     
@@ -132,7 +230,7 @@ class TimeoutLockManager:
     
     def acquire_lock(self, lock_id: str, timeout: float = 5.0) -> bool:
         """获取锁（带死锁检测和超时）"""
-        thread_id = threading.current_thread().name
+        thread_id = threading.get_ident()
         
         # 死锁检测
         if not self._deadlock_detector.register_lock_request(thread_id, lock_id):
@@ -161,7 +259,7 @@ class TimeoutLockManager:
     
     def release_lock(self, lock_id: str):
         """释放锁"""
-        thread_id = threading.current_thread().name
+        thread_id = threading.get_ident()
         
         with self._manager_lock:
             if lock_id in self._locks:
@@ -171,12 +269,20 @@ class TimeoutLockManager:
 class ThreadCoordinator:
     """线程协调器"""
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: Optional[int] = None, max_results: int = MAX_TASK_RESULTS):
+        # max_workers为0时在submit_task调用线程中直接执行任务（测试模式）
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
         self.max_workers = max_workers
-        self._task_queue = queue.PriorityQueue()
+        self._inline_mode = max_workers == 0
+        self.max_results = max_results
+        # 按优先级分桶的任务队列（下标为优先级值-1），同一优先级内先进先出
+        self._task_buckets = [deque() for _ in TaskPriority]
+        self._task_cond = threading.Condition()
         self._workers: List[threading.Thread] = []
         self._shutdown_event = threading.Event()
         self._results: Dict[str, Any] = {}
+        self._task_events: Dict[str, threading.Event] = {}  # 任务完成事件
         self._result_lock = threading.RLock()
         self._logger = logging.getLogger(__name__)
         
@@ -185,87 +291,139 @@ class ThreadCoordinator:
     
     def _start_workers(self):
         """启动工作线程"""
-        for i in range(self.max_workers):
-            worker = threading.Thread(
-                target=self._worker_loop,
-                name=f"Worker-{i}",
-                daemon=True
-            )
-            worker.start()
-            self._workers.append(worker)
+        if self._inline_mode:
+            return
+        
+        # 仅在创建工作线程期间使用较小的栈，之后恢复进程默认值
+        try:
+            previous_stack_size = threading.stack_size(WORKER_STACK_SIZE)
+        except (ValueError, RuntimeError):
+            previous_stack_size = None
+        try:
+            for i in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"Worker-{i}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+        finally:
+            if previous_stack_size is not None:
+                threading.stack_size(previous_stack_size)
+    
+    def _pop_task(self) -> Optional[Task]:
+        """从最高优先级的非空桶中取任务（调用方需持有_task_cond）"""
+        for bucket in reversed(self._task_buckets):
+            if bucket:
+                return bucket.popleft()
+        return None
+    
+    def _next_task(self, timeout: float) -> Optional[Task]:
+        """取出优先级最高的任务，超时返回None"""
+        with self._task_cond:
+            task = self._pop_task()
+            if task is None:
+                self._task_cond.wait(timeout)
+                task = self._pop_task()
+            return task
     
     def _worker_loop(self):
         """工作线程循环"""
         while not self._shutdown_event.is_set():
-            try:
-                # 获取任务（带超时）
-                priority, task = self._task_queue.get(timeout=1.0)
-                
+            # 获取任务（带超时）
+            task = self._next_task(timeout=1.0)
+            if task is None:
+                continue
+            
+            self._run_task(task)
+    
+    def _run_task(self, task: Task):
+        """执行任务并存储结果"""
+        try:
+            # 执行任务
+            start_time = time.time()
+            result = task.func(*task.args, **task.kwargs)
+            execution_time = time.time() - start_time
+            
+            # 存储结果并通知等待者
+            self._store_result(task.id, {
+                'result': result,
+                'execution_time': execution_time,
+                'success': True
+            })
+            
+            # 调用回调
+            if task.callback:
                 try:
-                    # 执行任务
-                    start_time = time.time()
-                    result = task.func(*task.args, **task.kwargs)
-                    execution_time = time.time() - start_time
-                    
-                    # 存储结果
-                    with self._result_lock:
-                        self._results[task.id] = {
-                            'result': result,
-                            'execution_time': execution_time,
-                            'success': True
-                        }
-                    
-                    # 调用回调
-                    if task.callback:
-                        try:
-                            task.callback(result)
-                        except Exception as e:
-                            self._logger.error(f"Task callback error: {e}")
-                
+                    task.callback(result)
                 except Exception as e:
-                    # 存储错误结果
-                    with self._result_lock:
-                        self._results[task.id] = {
-                            'error': str(e),
-                            'success': False
-                        }
-                    self._logger.error(f"Task execution error: {e}")
-                
-                finally:
-                    self._task_queue.task_done()
-            
-            except queue.Empty:
-                continue
+                    self._logger.error(f"Task callback error: {e}")
+        
+        except Exception as e:
+            # 存储错误结果并通知等待者
+            self._store_result(task.id, {
+                'error': str(e),
+                'success': False
+            })
+            self._logger.error(f"Task execution error: {e}")
+    
+    def _store_result(self, task_id: str, result_data: Dict[str, Any]):
+        """存储任务结果并通知等待者，超出上限时丢弃最早未取回的结果"""
+        dropped = None
+        with self._result_lock:
+            self._results[task_id] = result_data
+            if len(self._results) > self.max_results:
+                dropped = next(iter(self._results))
+                del self._results[dropped]
+                self._task_events.pop(dropped, None)
+            event = self._task_events.get(task_id)
+        
+        if dropped is not None:
+            self._logger.warning(f"Task result limit ({self.max_results}) exceeded, discarded result of {dropped}")
+        if event is not None:
+            event.set()
     
     def submit_task(self, task: Task) -> str:
         """提交任务"""
-        # 使用负优先级值实现高优先级优先
-        priority_value = -task.priority.value
-        self._task_queue.put((priority_value, task))
+        with self._result_lock:
+            self._task_events[task.id] = threading.Event()
+        if self._inline_mode:
+            self._run_task(task)
+            return task.id
+        with self._task_cond:
+            self._task_buckets[task.priority.value - 1].append(task)
+            self._task_cond.notify()
         self._logger.debug(f"Task {task.id} submitted with priority {task.priority}")
         return task.id
     
     def get_result(self, task_id: str, timeout: Optional[float] = None) -> Any:
-        """获取任务结果"""
-        start_time = time.time()
+        """获取任务结果（结果取出后即从协调器中移除）"""
+        with self._result_lock:
+            event = self._task_events.get(task_id)
+        if event is None:
+            raise KeyError(f"Unknown task {task_id}")
         
-        while True:
-            with self._result_lock:
-                if task_id in self._results:
-                    result_data = self._results[task_id]
-                    if result_data['success']:
-                        return result_data['result']
-                    else:
-                        raise Exception(result_data['error'])
-            
-            if timeout and (time.time() - start_time) > timeout:
-                raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
-            
-            time.sleep(0.01)
+        # 等待任务完成事件，无需轮询
+        if not event.wait(timeout):
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
+        
+        with self._result_lock:
+            self._task_events.pop(task_id, None)
+            result_data = self._results.pop(task_id, None)
+        
+        if result_data is None:
+            raise KeyError(f"Result of task {task_id} was discarded")
+        if result_data['success']:
+            return result_data['result']
+        else:
+            raise Exception(result_data['error'])
     
     def shutdown(self, timeout: float = 5.0):
         """关闭协调器"""
         self._shutdown_event.set()
+        with self._task_cond:
+            self._task_cond.notify_all()
         
         # 等待所有工作线程结束
         for worker in self._workers:
@@ -295,7 +453,8 @@ class ThreadManager:
             if hasattr(self, '_initialized'):
                 return
                 
-            self._coordinator = ThreadCoordinator(max_workers=4)
+            self._coordinator = ThreadCoordinator(max_workers=os.cpu_count() or 4)
+            self._task_ids = itertools.count(1)
             self._lock_manager = TimeoutLockManager()
             self._managed_threads: Dict[str, threading.Thread] = {}
             self._thread_lock = threading.RLock()
@@ -305,7 +464,11 @@ class ThreadManager:
     
     def create_thread(self, name: str, target: Callable, args: tuple = (), 
                      kwargs: dict = None, daemon: bool = True) -> threading.Thread:
-        """创建并管理线程"""
+        """创建并管理线程
+        
+        仅用于长期运行的循环（如模拟器的_simulation_loop），
+        短时任务请使用submit()复用线程池，避免每次创建线程的开销。
+        """
         if kwargs is None:
             kwargs = {}
             
@@ -325,7 +488,7 @@ class ThreadManager:
     
     def start_thread(self, name: str, target: Callable, args: tuple = (), 
                     kwargs: dict = None, daemon: bool = True) -> threading.Thread:
-        """创建并启动线程"""
+        """创建并启动线程（仅用于长期运行的循环，短时任务请使用submit()）"""
         thread = self.create_thread(name, target, args, kwargs, daemon)
         thread.start()
         self._logger.debug(f"Thread {name} started")
@@ -347,6 +510,17 @@ class ThreadManager:
         """提交任务到线程池"""
         return self._coordinator.submit_task(task)
     
+    def submit(self, func: Callable, *args,
+               priority: TaskPriority = TaskPriority.NORMAL, **kwargs) -> str:
+        """将函数调用包装为任务提交到线程池
+        
+        Returns:
+            任务ID，可用于get_task_result获取结果
+        """
+        task_id = f"{getattr(func, '__name__', 'task')}-{next(self._task_ids)}"
+        task = Task(id=task_id, func=func, args=args, kwargs=kwargs, priority=priority)
+        return self._coordinator.submit_task(task)
+    
     def get_task_result(self, task_id: str, timeout: Optional[float] = None) -> Any:
         """获取任务结果"""
         return self._coordinator.get_result(task_id, timeout)
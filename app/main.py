@@ -7,19 +7,21 @@ FilePath: /Demo/app/main.py
 '''
 import sys
 import os
+import time
 import numpy as np
 import math
+import functools
+from collections import deque
+import importlib.util
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QComboBox, QSpinBox, QDoubleSpinBox,
-                             QGroupBox, QLineEdit, QTextEdit, QSlider, QFileDialog, QDesktopWidget,
-                             QSpacerItem, QSizePolicy, QTabWidget, QScrollArea, QSplitter,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QDockWidget,
+                             QGroupBox, QLineEdit, QTextEdit, QPlainTextEdit, QSlider, QFileDialog, QDesktopWidget,
+                             QSpacerItem, QSizePolicy, QTabWidget, QScrollArea, QSplitter, QStackedWidget,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QDockWidget, QFormLayout,
                              QGraphicsScene, QGraphicsView, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QColor, QBrush, QFont
-import qtawesome as qta
+from PyQt5.QtCore import Qt, QTimer, QObject, QThread, QSignalBlocker, QRegularExpression, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QColor, QBrush, QFont, QPalette, QRegularExpressionValidator
 import argparse
-import pyqtgraph as pg
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
@@ -47,28 +49,157 @@ from app.visualization.gl_renderer import GLRenderer
 # 模型层
 from app.model.robot_model import RobotModel
 
-# ROS支持
+# 工具
+from app.utils.ring_buffer import RingBuffer
+
+# ROS支持（只检测是否安装，rospy/roslaunch在init_ros中按需导入）
+ROS_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('rospy', 'roslaunch'))
+
+# Numba支持（可选，用于编译标量四元数转换）
 try:
-    import rospy
-    import roslaunch
-    ROS_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    ROS_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
-def quaternion_to_euler(qw, qx, qy, qz):
-    """
-    将四元数转换为欧拉角（ZYX顺序，即Yaw-Pitch-Roll）
-    
-    Args:
-        qw, qx, qy, qz: 四元数分量
-    
-    Returns:
-        tuple: (roll, pitch, yaw) 欧拉角，单位为弧度
-    """
+@functools.lru_cache(maxsize=None)
+def _load_pyqtgraph():
+    """按需导入pyqtgraph，首次导入时启用OpenGL加速（需安装PyOpenGL）"""
+    import pyqtgraph as pg
+    try:
+        import OpenGL  # noqa: F401
+        pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+    except ImportError:
+        pass
+    return pg
+
+# 角度转弧度换算常数（弧度转角度统一用np.degrees）
+_DEG2RAD = math.pi / 180.0
+
+# 可选机器人型号与TCP/IP工作模式
+_MODEL_NAMES = ('Rizon 4', 'Rizon 4s', 'Rizon 10', 'Rizon 10s')
+_TCPIP_MODES = ('Client', 'Server')
+
+# 监控曲线的颜色、名称与线型
+_JOINT_COLORS = ('#e41a1c', '#377eb8', '#4daf4a', '#984ea3', '#ff7f00', '#a65628', '#f781bf')
+_JOINT_NAMES = ('关节1 (Base)', '关节2 (Shoulder)', '关节3 (Elbow)', '关节4 (Wrist1)',
+                '关节5 (Wrist2)', '关节6 (Wrist3)', '关节7 (Flange)')
+_FT_COLORS = ('#DC143C', '#4169E1', '#32CD32', '#FF8C00', '#9932CC', '#8B4513')
+_FT_STYLES = (Qt.SolidLine,) * 3 + (Qt.DashLine,) * 3
+_FT_NAMES = ("Fx (X轴力)", "Fy (Y轴力)", "Fz (Z轴力)", "Tx (X轴力矩)", "Ty (Y轴力矩)", "Tz (Z轴力矩)")
+
+# IPv4地址格式（每段0-255）
+_IPV4_OCTET = r'(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_IPV4_PATTERN = rf'^({_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}$'
+
+# 通信配置表单：(属性名, 标签, 类型, 默认值, 数值范围, 占位文本)，类型'ip'为带IPv4校验的文本框
+_TCPIP_COMMON_FORM = (
+    ('tcpip_timeout_input', '超时时间(秒):', 'number', 5, (1, 60), None),
+    ('tcpip_keepalive_check', '保持连接:', 'checkbox', True, None, None),
+)
+_TCPIP_CLIENT_FORM = (
+    ('tcpip_client_host_input', '服务器IP:', 'ip', '192.168.1.100', None, '192.168.1.100'),
+    ('tcpip_client_port_input', '服务器端口:', 'number', 8080, (1, 65535), None),
+    ('tcpip_client_reconnect_check', '自动重连:', 'checkbox', True, None, None),
+    ('tcpip_client_interval_input', '重连间隔(秒):', 'number', 5, (1, 300), None),
+)
+_TCPIP_SERVER_FORM = (
+    ('tcpip_server_port_input', '监听端口:', 'number', 8080, (1, 65535), None),
+    ('tcpip_server_bind_input', '绑定地址:', 'ip', '0.0.0.0', None, '0.0.0.0 (所有接口)'),
+    ('tcpip_server_max_conn_input', '最大连接数:', 'number', 10, (1, 100), None),
+)
+_PROFINET_FORM = (
+    ('profinet_device_name', '设备名称:', 'text', 'robot-controller', None, 'robot-controller'),
+    ('profinet_ip_input', 'IP地址:', 'ip', '192.168.1.50', None, '192.168.1.50'),
+    ('profinet_mask_input', '子网掩码:', 'ip', '255.255.255.0', None, '255.255.255.0'),
+    ('profinet_gateway_input', '网关地址:', 'ip', '192.168.1.1', None, '192.168.1.1'),
+    ('profinet_station_input', '站号:', 'number', 1, (1, 255), None),
+)
+_MODBUS_FORM = (
+    ('modbus_host_input', 'IP地址:', 'ip', '192.168.1.200', None, '192.168.1.200'),
+    ('modbus_port_input', '端口:', 'number', 502, (1, 65535), None),
+    ('modbus_slave_input', '从站地址:', 'number', 1, (1, 255), None),
+    ('modbus_timeout_input', '超时时间(秒):', 'number', 3, (1, 60), None),
+    ('modbus_retry_input', '重试次数:', 'number', 3, (0, 10), None),
+)
+
+# 监控图表标签页样式
+_MONITOR_TAB_QSS = """
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #f0f0f0;
+        border: 1px solid #cccccc;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        padding: 6px 12px;
+        margin-right: 2px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QTabBar::tab:selected {
+        background-color: white;
+        border-bottom: 1px solid white;
+    }
+    QTabBar::tab:hover {
+        background-color: #e0e0e0;
+    }
+"""
+
+# 监控图表控制按钮样式
+_CHART_CTRL_BTN_QSS = """
+    QPushButton#chartCtrlBtn {
+        background-color: #f0f0f0;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 11px;
+        font-weight: bold;
+        color: #333;
+    }
+    QPushButton#chartCtrlBtn:hover {
+        background-color: #e0e0e0;
+        border-color: #999;
+    }
+    QPushButton#chartCtrlBtn:pressed {
+        background-color: #d0d0d0;
+        border-color: #666;
+    }
+"""
+
+# 3D视图/分屏控制按钮样式
+_SPLITTER_BTN_QSS = """
+    QPushButton#splitterBtn {
+        background-color: #e8f4fd;
+        border: 1px solid #4a90e2;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 10px;
+        color: #2c5aa0;
+    }
+    QPushButton#splitterBtn:hover {
+        background-color: #d0e7fa;
+    }
+    QPushButton#splitterBtn:pressed {
+        background-color: #b8daf7;
+    }
+    QPushButton#splitterBtn:checked {
+        background-color: #ff6b6b;
+        border-color: #ff5252;
+        color: white;
+    }
+"""
+
+def _quaternion_to_euler_scalar(qw, qx, qy, qz):
+    """单个四元数转欧拉角的标量实现，Numba可用时编译为本地代码"""
     # 归一化四元数
     norm = math.sqrt(qw*qw + qx*qx + qy*qy + qz*qz)
     if norm == 0:
-        return (0, 0, 0)
+        return (0.0, 0.0, 0.0)
     qw, qx, qy, qz = qw/norm, qx/norm, qy/norm, qz/norm
     
     # 转换为欧拉角
@@ -91,6 +222,77 @@ def quaternion_to_euler(qw, qx, qy, qz):
     
     return (roll, pitch, yaw)
 
+if NUMBA_AVAILABLE:
+    _quaternion_to_euler_scalar = njit(cache=True, fastmath=True)(_quaternion_to_euler_scalar)
+
+def quaternion_to_euler(qw, qx, qy, qz):
+    """
+    将四元数转换为欧拉角（ZYX顺序，即Yaw-Pitch-Roll）
+    
+    Args:
+        qw, qx, qy, qz: 四元数分量
+    
+    Returns:
+        tuple: (roll, pitch, yaw) 欧拉角，单位为弧度
+    """
+    return _quaternion_to_euler_scalar(float(qw), float(qx), float(qy), float(qz))
+
+def quaternion_to_euler_batch(quaternions):
+    """
+    批量将四元数转换为欧拉角（ZYX顺序），整列向量化计算
+    
+    Args:
+        quaternions: 形状为(N, 4)的数组，每行为[qw, qx, qy, qz]
+    
+    Returns:
+        np.ndarray: 形状为(N, 3)的数组，每行为[roll, pitch, yaw]，单位为弧度
+    """
+    q = np.array(quaternions, dtype=np.float64, ndmin=2)
+    # 归一化四元数，零四元数保持为零并输出零角度
+    norm = np.linalg.norm(q, axis=1, keepdims=True)
+    np.divide(q, norm, out=q, where=norm != 0)
+    qw, qx, qy, qz = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    
+    euler = np.empty((q.shape[0], 3))
+    euler[:, 0] = np.arctan2(2 * (qw * qx + qy * qz), 1 - 2 * (qx * qx + qy * qy))
+    euler[:, 1] = np.arcsin(np.clip(2 * (qw * qy - qz * qx), -1.0, 1.0))
+    euler[:, 2] = np.arctan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
+    euler[norm[:, 0] == 0] = 0.0
+    return euler
+
+class RobotStateWorker(QObject):
+    """
+    通信层：在独立线程中定时采集机器人关节状态，通过信号交给界面线程
+    """
+    joint_state_ready = pyqtSignal(object)
+
+    def __init__(self, robot_control, interval_ms=50):
+        super().__init__()
+        self.robot_control = robot_control
+        self._interval_ms = interval_ms
+        self._timer = None
+        self._last_angles = None
+
+    @pyqtSlot()
+    def start(self):
+        """在工作线程中创建并启动采集定时器"""
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start(self._interval_ms)
+
+    @pyqtSlot()
+    def poll(self):
+        """采集一次关节状态，阻塞的硬件调用不会卡住界面线程"""
+        try:
+            angles = self.robot_control.get_joint_angles()
+        except Exception:
+            return
+        # 状态未变化时不通知界面线程，机器人静止时界面无需唤醒
+        if self._last_angles is not None and np.array_equal(angles, self._last_angles):
+            return
+        self._last_angles = angles
+        self.joint_state_ready.emit(angles)
+
 class RobotArmControlApp(QMainWindow):
     """
     界面层：主窗口，负责UI交互、模型导入、关节控制、状态显示等
@@ -129,22 +331,46 @@ class RobotArmControlApp(QMainWindow):
         self.robot_model = None  # 机器人模型实例
         self.joint_curves = []
         self.ee_curve = None
+        # 界面控件占位（由各界面构建函数创建），刷新槽函数据此判空而非hasattr
+        self.gl_renderer = None
+        self.tcpip_server_conn_count_label = None
+        self._joint_pos_labels = None
+        self._joint_torque_labels = None
+        self._tcp_value_labels = None
+        self.monitor_velocity_label = None
+        self.ft_labels = None
         
         # 关节状态保存变量（用于仿真模式重连时恢复状态）
         self.saved_joint_angles = None
         # 用户交互标记（防止update_robot_state覆盖用户拖动）
         self.user_interacting = False
+        # 上次写入界面的关节显示值，数值未变化时跳过控件刷新
+        self._last_joint_deg = [None] * 7
+        self._last_joint_text = [None] * 7
+        self._last_render_angles = None
+        # ROS关节状态按名称写入预分配缓冲区，回调中不再逐帧构造字典
+        self._joint_name_to_idx = {f'joint{i + 1}': i for i in range(7)}
+        self._joint_buf = np.zeros(7)
+        # 消息中关节名称顺序通常固定，缓存由名称顺序推出的源/目标下标
+        self._ros_joint_names = None
+        self._ros_src_idx = None
+        self._ros_dst_idx = None
 
         # 通信层
         self.serial_comm = SerialCommunication()
         self.robot_control = RobotControl(robot=self.robot, robot_model=self.robot_model, hardware=self.hardware)
         # 新增：抓手控制器
         self.gripper_control = GripperControl(robot=self.robot)
-        # 信号绑定
-        self.gripper_control.gripper_state_updated.connect(self.update_gripper_state)
-        self.gripper_control.gripper_param_updated.connect(self.update_gripper_param)
-        self.gripper_control.gripper_error.connect(self.show_gripper_error)
+        # 信号绑定（抓手状态由监控线程发出，显式使用排队连接）
+        self.gripper_control.gripper_state_updated.connect(self.update_gripper_state, Qt.QueuedConnection)
+        self.gripper_control.gripper_param_updated.connect(self.update_gripper_param, Qt.QueuedConnection)
+        self.gripper_control.gripper_error.connect(self.show_gripper_error, Qt.QueuedConnection)
 
+        # 界面构建期间排队的信号连接，窗口显示后统一建立
+        self._pending_connections = []
+        # 所有IP地址输入框共用的IPv4校验器
+        self._ipv4_validator = QRegularExpressionValidator(QRegularExpression(_IPV4_PATTERN), self)
+        
         # 初始化UI
         self.init_ui_components()
         self.load_last_robot_sn()
@@ -152,20 +378,30 @@ class RobotArmControlApp(QMainWindow):
         # ROS初始化
         self.init_ros()
         
-        # 定时器：实时刷新机器人状态
+        # 采集机器人状态(20Hz, 独立线程)与刷新界面(10Hz, 界面线程)分离
+        self._latest_angles = None
+        self._state_thread = QThread(self)
+        self._state_worker = RobotStateWorker(self.robot_control, interval_ms=50)
+        self._state_worker.moveToThread(self._state_thread)
+        self._state_thread.started.connect(self._state_worker.start)
+        self._state_worker.joint_state_ready.connect(self._on_joint_state_ready, Qt.QueuedConnection)
+        self._state_thread.start()
+        # 界面刷新由新数据触发的单次定时器合并，最高10Hz，无新数据时不唤醒
         self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(100)  # 10Hz
         self.update_timer.timeout.connect(self.update_robot_state)
-        self.update_timer.start(50)  # 20Hz
         # 显示当前模式
         mode_str = '硬件模式' if self.hardware else '仿真/教学模式'
         self.global_status_text.append(f'当前运行模式：{mode_str}')
         # 可视化联动
-        self.robot_control.joint_updated.connect(self.gl_renderer.update_joint_positions)
+        self.robot_control.joint_updated.connect(self._render_joint_positions, Qt.QueuedConnection)
 
     def init_ros(self):
         """通信层：初始化ROS相关组件"""
         if ROS_AVAILABLE:
             try:
+                import rospy
                 rospy.init_node('robot_arm_control', anonymous=True)
                 from sensor_msgs.msg import JointState
                 self.joint_state_sub = rospy.Subscriber(
@@ -180,24 +416,67 @@ class RobotArmControlApp(QMainWindow):
 
     def joint_state_callback(self, msg):
         """通信层：ROS关节状态回调"""
-        joint_angles = {name: pos for name, pos in zip(msg.name, msg.position)}
-        if hasattr(self, 'gl_renderer') and self.gl_renderer:
+        names = tuple(msg.name)
+        if names != self._ros_joint_names:
+            pairs = [(src, self._joint_name_to_idx[name]) for src, name in enumerate(names)
+                     if name in self._joint_name_to_idx]
+            self._ros_src_idx = np.array([src for src, _ in pairs], dtype=np.intp)
+            self._ros_dst_idx = np.array([dst for _, dst in pairs], dtype=np.intp)
+            self._ros_joint_names = names
+        # numpy_msg反序列化时position已是ndarray，asarray不复制；普通消息为元组，一次性转换
+        positions = np.asarray(msg.position, dtype=np.float64)
+        if len(positions) < len(names):
+            return
+        self._joint_buf[self._ros_dst_idx] = positions[self._ros_src_idx]
+        self._render_joint_positions(self._joint_buf)
+
+    def _render_joint_positions(self, joint_angles):
+        """可视化层：将关节位置推送到3D视图，视图隐藏时跳过"""
+        if self.gl_renderer is not None and self.gl_renderer.isVisible():
             self.gl_renderer.update_joint_positions(joint_angles)
 
+    def _on_joint_state_ready(self, angles):
+        """通信层：接收采集线程的关节状态（不操作界面控件）"""
+        # 界面刷新时读取最新一次采集结果
+        self._latest_angles = angles
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
     def update_robot_state(self):
-        """通信层：定时更新机器人状态"""
-        if hasattr(self, 'robot_control') and self.robot_control:
-            angles = self.robot_control.get_joint_angles()
-            # 只有在用户没有交互时才更新滑块值，防止覆盖用户拖动
-            if not self.user_interacting:
-                for i, angle in enumerate(angles):
-                    if i < len(self.joint_sliders):
-                        self.joint_sliders[i].blockSignals(True)
-                        self.joint_sliders[i].setValue(int(angle * 180 / np.pi))
-                        self.joint_sliders[i].blockSignals(False)
-                        self.joint_values[i].setText(f"{angle * 180 / np.pi:.2f}°")
-            if hasattr(self, 'gl_renderer') and self.gl_renderer:
+        """通信层：定时将最新采集的机器人状态刷新到界面"""
+        # 窗口最小化/隐藏时不刷新，恢复显示时由changeEvent补刷
+        if self.isMinimized() or not self.isVisible():
+            return
+        angles = self._latest_angles
+        # 用户拖动滑块时滑块和3D视图都以用户输入为准，松开后再补刷
+        if angles is None or self.user_interacting:
+            return
+        degs = np.degrees(np.asarray(angles, dtype=float)[:len(self.joint_sliders)])
+        # 整数角度与显示文本一次性向量化生成，循环内只做比较
+        deg_values = degs.astype(int).tolist()
+        texts = np.char.mod('%.2f°', degs).tolist()
+        # 仅在整数角度变化时刷新滑块，变化的滑块在一次批量更新中统一屏蔽信号
+        last_deg = self._last_joint_deg
+        changed = [i for i, value in enumerate(deg_values) if value != last_deg[i]]
+        if changed:
+            self._joint_group.setUpdatesEnabled(False)
+            blockers = [QSignalBlocker(self.joint_sliders[i]) for i in changed]
+            for i in changed:
+                self.joint_sliders[i].setValue(deg_values[i])
+                last_deg[i] = deg_values[i]
+            for blocker in blockers:
+                blocker.unblock()
+            self._joint_group.setUpdatesEnabled(True)
+        last_text = self._last_joint_text
+        for i, text in enumerate(texts):
+            if text != last_text[i]:
+                self.joint_values[i].setText(text)
+                last_text[i] = text
+        # 3D视图隐藏时跳过渲染更新，重新显示时由toggle_3d_view补刷
+        if self.gl_renderer is not None and self.gl_renderer.isVisible():
+            if self._last_render_angles is None or not np.array_equal(angles, self._last_render_angles):
                 self.gl_renderer.set_joint_angles(angles)
+                self._last_render_angles = list(angles)
 
     def init_ui_components(self):
         """界面层：初始化所有UI组件"""
@@ -218,6 +497,8 @@ class RobotArmControlApp(QMainWindow):
         self.left_tab = QTabWidget()
         self.left_tab.setMinimumWidth(350)
         self.left_tab.setMaximumWidth(500)
+        # 构建各页期间暂停绘制，避免每个折叠分组加入时都触发重绘
+        self.left_tab.setUpdatesEnabled(False)
         # 机器人操作页
         op_scroll = QScrollArea()
         op_scroll.setWidgetResizable(True)
@@ -251,7 +532,9 @@ class RobotArmControlApp(QMainWindow):
         op_layout.addWidget(self.create_collapsible_group(self.create_robot_ops_group(), '机器人操作'))
         op_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         # 3D视图和分屏控制按钮
-        view_control_layout = QHBoxLayout()
+        view_control_bar = QWidget()
+        view_control_layout = QHBoxLayout(view_control_bar)
+        view_control_layout.setContentsMargins(0, 0, 0, 0)
         
         # 3D视图控制
         self.btn_toggle_3d_view = QPushButton('隐藏3D视图')
@@ -263,31 +546,10 @@ class RobotArmControlApp(QMainWindow):
         btn_split_left = QPushButton('左侧优先')
         btn_split_right = QPushButton('右侧优先')
         
-        # 设置按钮样式
-        splitter_btn_style = """
-            QPushButton {
-                background-color: #e8f4fd;
-                border: 1px solid #4a90e2;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 10px;
-                color: #2c5aa0;
-            }
-            QPushButton:hover {
-                background-color: #d0e7fa;
-            }
-            QPushButton:pressed {
-                background-color: #b8daf7;
-            }
-            QPushButton:checked {
-                background-color: #ff6b6b;
-                border-color: #ff5252;
-                color: white;
-            }
-        """
-        
+        # 设置按钮样式：样式表只在容器上设置一次，按objectName匹配各按钮
+        view_control_bar.setStyleSheet(_SPLITTER_BTN_QSS)
         for btn in [self.btn_toggle_3d_view, btn_split_equal, btn_split_left, btn_split_right]:
-            btn.setStyleSheet(splitter_btn_style)
+            btn.setObjectName('splitterBtn')
             btn.setMaximumHeight(28)
         
         view_control_layout.addWidget(QLabel('3D视图:'))
@@ -304,7 +566,7 @@ class RobotArmControlApp(QMainWindow):
         btn_split_left.clicked.connect(self.set_splitter_left_priority)
         btn_split_right.clicked.connect(self.set_splitter_right_priority)
         
-        op_layout.addLayout(view_control_layout)
+        op_layout.addWidget(view_control_bar)
         
         # 视角操作按钮
         view_btn_layout = QHBoxLayout()
@@ -379,6 +641,7 @@ class RobotArmControlApp(QMainWindow):
         global_vars_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         global_vars_scroll.setWidget(global_vars_page)
         self.left_tab.addTab(global_vars_scroll, '全局变量')
+        self.left_tab.setUpdatesEnabled(True)
         
         # 高级控制页已移除
         # Splitter布局 - 优化分屏功能
@@ -504,6 +767,10 @@ class RobotArmControlApp(QMainWindow):
             
             self.joint_labels[f'A{i+1}_pos'] = pos_label
             self.joint_labels[f'A{i+1}_torque'] = torque_label
+        # 按关节顺序保存标签引用，刷新时直接setText而无需拼接字典键
+        self._joint_pos_labels = [self.joint_labels[f'A{i+1}_pos'] for i in range(7)]
+        self._last_joint_pos_texts = [None] * 7
+        self._joint_torque_labels = [self.joint_labels[f'A{i+1}_torque'] for i in range(7)]
         
         # TCP位姿数据 - 紧凑平铺布局
         tcp_group = QGroupBox('TCP位姿')
@@ -522,6 +789,7 @@ class RobotArmControlApp(QMainWindow):
             tcp_layout.addWidget(value_label, i, 1)
             
             self.tcp_labels[param] = value_label
+        self._tcp_value_labels = [self.tcp_labels[param] for param in tcp_params]
         
 
         
@@ -686,7 +954,6 @@ class RobotArmControlApp(QMainWindow):
         comm_layout.addLayout(protocol_layout)
         
         # 创建堆叠窗口用于不同协议的配置界面
-        from PyQt5.QtWidgets import QStackedWidget
         self.protocol_stack = QStackedWidget()
         
         # 串口配置页面
@@ -782,6 +1049,31 @@ class RobotArmControlApp(QMainWindow):
         
         return widget
     
+    def _build_form(self, spec):
+        """
+        界面层：按表单描述批量创建标签+输入控件行
+        
+        Args:
+            spec: (属性名, 标签, 类型, 默认值, 数值范围, 占位文本) 元组序列
+            
+        Returns:
+            tuple: (QWidget, QFormLayout) 表单容器及其布局，调用方可继续追加行
+        """
+        from app.utils.ui_utils import create_label, create_input_field
+        
+        widget = QWidget()
+        # 输入框保持原有宽度，不随表单拉伸
+        layout = QFormLayout(widget)
+        layout.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
+        for attr, label, kind, default, value_range, placeholder in spec:
+            field = create_input_field('text' if kind == 'ip' else kind, default,
+                                       range_values=value_range, placeholder=placeholder)
+            if kind == 'ip':
+                field.setValidator(self._ipv4_validator)
+            setattr(self, attr, field)
+            layout.addRow(create_label(label, bold=True), field)
+        return widget, layout
+    
     def create_tcpip_config_widget(self):
         """TCP/IP配置界面（使用UI工具函数）"""
         from app.utils.ui_utils import create_group_box, create_label, create_input_field
@@ -792,252 +1084,88 @@ class RobotArmControlApp(QMainWindow):
         # 模式选择
         mode_layout = QHBoxLayout()
         mode_layout.addWidget(create_label('工作模式:', bold=True))
-        self.tcpip_mode_combo = create_input_field('combo', 'Client', ['Client', 'Server'])
-        self.tcpip_mode_combo.currentTextChanged.connect(self.on_tcpip_mode_changed)
+        self.tcpip_mode_combo = create_input_field('combo', 'Client', _TCPIP_MODES)
+        self.tcpip_mode_combo.currentIndexChanged[int].connect(self.on_tcpip_mode_changed)
         mode_layout.addWidget(self.tcpip_mode_combo)
         mode_layout.addStretch()
         layout.addLayout(mode_layout)
         
         # 创建堆叠窗口用于不同模式的配置界面
-        from PyQt5.QtWidgets import QStackedWidget
         self.tcpip_mode_stack = QStackedWidget()
         
-        # Client模式配置
+        # Client模式配置（默认模式，立即构建）
         client_widget = self.create_tcpip_client_widget()
         self.tcpip_mode_stack.addWidget(client_widget)
         
-        # Server模式配置
-        server_widget = self.create_tcpip_server_widget()
-        self.tcpip_mode_stack.addWidget(server_widget)
+        # Server模式配置先放占位页，首次切换到该模式时再构建
+        self.tcpip_mode_stack.addWidget(QWidget())
+        self._tcpip_page_builders = {0: self.create_tcpip_client_widget, 1: self.create_tcpip_server_widget}
+        self._tcpip_page_built = {0: True, 1: False}
         
         layout.addWidget(self.tcpip_mode_stack)
         
-        # 通用设置
+        # 通用设置（超时时间、保持连接）
         common_group = create_group_box('通用设置', 'vertical')
-        common_layout = common_group.layout()
-        
-        # 连接超时设置
-        timeout_layout = QHBoxLayout()
-        timeout_layout.addWidget(create_label('超时时间(秒):', bold=True))
-        self.tcpip_timeout_input = create_input_field('number', 5, [1, 60])
-        timeout_layout.addWidget(self.tcpip_timeout_input)
-        timeout_layout.addStretch()
-        common_layout.addLayout(timeout_layout)
-        
-        # 保持连接设置
-        keepalive_layout = QHBoxLayout()
-        self.tcpip_keepalive_check = create_input_field('checkbox', True)
-        keepalive_layout.addWidget(self.tcpip_keepalive_check)
-        keepalive_layout.addWidget(create_label('保持连接', bold=True))
-        keepalive_layout.addStretch()
-        common_layout.addLayout(keepalive_layout)
-        
+        common_form, _ = self._build_form(_TCPIP_COMMON_FORM)
+        common_group.layout().addWidget(common_form)
         layout.addWidget(common_group)
         
         return widget
     
     def create_tcpip_client_widget(self):
-        """TCP/IP Client模式配置界面（使用UI工具函数）"""
-        from app.utils.ui_utils import create_label, create_input_field
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # 目标服务器IP地址
-        ip_layout = QHBoxLayout()
-        ip_layout.addWidget(create_label('服务器IP:', bold=True))
-        self.tcpip_client_host_input = create_input_field('text', '192.168.1.100')
-        self.tcpip_client_host_input.setPlaceholderText('192.168.1.100')
-        ip_layout.addWidget(self.tcpip_client_host_input)
-        ip_layout.addStretch()
-        layout.addLayout(ip_layout)
-        
-        # 目标服务器端口
-        port_layout = QHBoxLayout()
-        port_layout.addWidget(create_label('服务器端口:', bold=True))
-        self.tcpip_client_port_input = create_input_field('number', 8080, [1, 65535])
-        port_layout.addWidget(self.tcpip_client_port_input)
-        port_layout.addStretch()
-        layout.addLayout(port_layout)
-        
-        # 自动重连设置
-        reconnect_layout = QHBoxLayout()
-        self.tcpip_client_reconnect_check = create_input_field('checkbox', True)
-        reconnect_layout.addWidget(self.tcpip_client_reconnect_check)
-        reconnect_layout.addWidget(create_label('自动重连', bold=True))
-        reconnect_layout.addStretch()
-        layout.addLayout(reconnect_layout)
-        
-        # 重连间隔
-        interval_layout = QHBoxLayout()
-        interval_layout.addWidget(create_label('重连间隔(秒):', bold=True))
-        self.tcpip_client_interval_input = create_input_field('number', 5, [1, 300])
-        interval_layout.addWidget(self.tcpip_client_interval_input)
-        interval_layout.addStretch()
-        layout.addLayout(interval_layout)
-        
+        """TCP/IP Client模式配置界面（服务器IP、端口、自动重连、重连间隔）"""
+        widget, _ = self._build_form(_TCPIP_CLIENT_FORM)
         return widget
     
     def create_tcpip_server_widget(self):
-        """TCP/IP Server模式配置界面（使用UI工具函数）"""
-        from app.utils.ui_utils import create_label, create_input_field
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
+        """TCP/IP Server模式配置界面（监听端口、绑定地址、最大连接数、当前连接数）"""
+        from app.utils.ui_utils import create_label
         
-        # 监听端口
-        port_layout = QHBoxLayout()
-        port_layout.addWidget(create_label('监听端口:', bold=True))
-        self.tcpip_server_port_input = create_input_field('number', 8080, [1, 65535])
-        port_layout.addWidget(self.tcpip_server_port_input)
-        port_layout.addStretch()
-        layout.addLayout(port_layout)
-        
-        # 监听地址
-        bind_layout = QHBoxLayout()
-        bind_layout.addWidget(create_label('绑定地址:', bold=True))
-        self.tcpip_server_bind_input = create_input_field('text', '0.0.0.0')
-        self.tcpip_server_bind_input.setPlaceholderText('0.0.0.0 (所有接口)')
-        bind_layout.addWidget(self.tcpip_server_bind_input)
-        bind_layout.addStretch()
-        layout.addLayout(bind_layout)
-        
-        # 最大连接数
-        max_conn_layout = QHBoxLayout()
-        max_conn_layout.addWidget(create_label('最大连接数:', bold=True))
-        self.tcpip_server_max_conn_input = create_input_field('number', 10, [1, 100])
-        max_conn_layout.addWidget(self.tcpip_server_max_conn_input)
-        max_conn_layout.addStretch()
-        layout.addLayout(max_conn_layout)
+        widget, layout = self._build_form(_TCPIP_SERVER_FORM)
         
         # 连接状态显示
-        status_layout = QHBoxLayout()
-        status_layout.addWidget(create_label('当前连接数:', bold=True))
         self.tcpip_server_conn_count_label = QLabel('0')
-        self.tcpip_server_conn_count_label.setStyleSheet('font-weight: bold; color: blue;')
-        status_layout.addWidget(self.tcpip_server_conn_count_label)
-        status_layout.addStretch()
-        layout.addLayout(status_layout)
+        # 连接数颜色用调色板切换，状态更新时不再解析样式表
+        count_font = self.tcpip_server_conn_count_label.font()
+        count_font.setBold(True)
+        self.tcpip_server_conn_count_label.setFont(count_font)
+        self._conn_count_palettes = []
+        for color in ('blue', 'green'):
+            palette = QPalette(self.tcpip_server_conn_count_label.palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._conn_count_palettes.append(palette)
+        self.tcpip_server_conn_count_label.setPalette(self._conn_count_palettes[0])
+        layout.addRow(create_label('当前连接数:', bold=True), self.tcpip_server_conn_count_label)
         
         return widget
     
-    def on_tcpip_mode_changed(self, mode):
-        """TCP/IP模式切换处理"""
-        if mode == 'Client':
-            self.tcpip_mode_stack.setCurrentIndex(0)
-        elif mode == 'Server':
-            self.tcpip_mode_stack.setCurrentIndex(1)
+    def on_tcpip_mode_changed(self, index):
+        """TCP/IP模式切换处理（下拉框索引与堆叠页索引一一对应）"""
+        if index < 0:
+            return
+        if not self._tcpip_page_built[index]:
+            # 懒加载：用真实页面替换占位页
+            placeholder = self.tcpip_mode_stack.widget(index)
+            self.tcpip_mode_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.tcpip_mode_stack.insertWidget(index, self._tcpip_page_builders[index]())
+            self._tcpip_page_built[index] = True
+        self.tcpip_mode_stack.setCurrentIndex(index)
     
     def update_tcpip_server_status(self, connection_count=0):
         """更新TCP/IP Server连接状态"""
-        if hasattr(self, 'tcpip_server_conn_count_label'):
+        if self.tcpip_server_conn_count_label is not None:
             self.tcpip_server_conn_count_label.setText(str(connection_count))
-            if connection_count > 0:
-                self.tcpip_server_conn_count_label.setStyleSheet('font-weight: bold; color: green;')
-            else:
-                self.tcpip_server_conn_count_label.setStyleSheet('font-weight: bold; color: blue;')
+            self.tcpip_server_conn_count_label.setPalette(self._conn_count_palettes[connection_count > 0])
     
     def create_profinet_config_widget(self):
-        """Profinet配置界面（使用UI工具函数）"""
-        from app.utils.ui_utils import create_label, create_input_field
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # 设备名称
-        name_layout = QHBoxLayout()
-        name_layout.addWidget(create_label('设备名称:', bold=True))
-        self.profinet_device_name = create_input_field('text', 'robot-controller')
-        self.profinet_device_name.setPlaceholderText('robot-controller')
-        name_layout.addWidget(self.profinet_device_name)
-        name_layout.addStretch()
-        layout.addLayout(name_layout)
-        
-        # IP地址设置
-        ip_layout = QHBoxLayout()
-        ip_layout.addWidget(create_label('IP地址:', bold=True))
-        self.profinet_ip_input = create_input_field('text', '192.168.1.50')
-        self.profinet_ip_input.setPlaceholderText('192.168.1.50')
-        ip_layout.addWidget(self.profinet_ip_input)
-        ip_layout.addStretch()
-        layout.addLayout(ip_layout)
-        
-        # 子网掩码
-        mask_layout = QHBoxLayout()
-        mask_layout.addWidget(create_label('子网掩码:', bold=True))
-        self.profinet_mask_input = create_input_field('text', '255.255.255.0')
-        self.profinet_mask_input.setPlaceholderText('255.255.255.0')
-        mask_layout.addWidget(self.profinet_mask_input)
-        mask_layout.addStretch()
-        layout.addLayout(mask_layout)
-        
-        # 网关地址
-        gateway_layout = QHBoxLayout()
-        gateway_layout.addWidget(create_label('网关地址:', bold=True))
-        self.profinet_gateway_input = create_input_field('text', '192.168.1.1')
-        self.profinet_gateway_input.setPlaceholderText('192.168.1.1')
-        gateway_layout.addWidget(self.profinet_gateway_input)
-        gateway_layout.addStretch()
-        layout.addLayout(gateway_layout)
-        
-        # 站号设置
-        station_layout = QHBoxLayout()
-        station_layout.addWidget(create_label('站号:', bold=True))
-        self.profinet_station_input = create_input_field('number', 1, [1, 255])
-        station_layout.addWidget(self.profinet_station_input)
-        station_layout.addStretch()
-        layout.addLayout(station_layout)
-        
+        """Profinet配置界面（设备名称、IP地址、子网掩码、网关地址、站号）"""
+        widget, _ = self._build_form(_PROFINET_FORM)
         return widget
     
     def create_modbus_config_widget(self):
-        """ModBus TCP/IP配置界面（使用UI工具函数）"""
-        from app.utils.ui_utils import create_label, create_input_field
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # IP地址设置
-        ip_layout = QHBoxLayout()
-        ip_layout.addWidget(create_label('IP地址:', bold=True))
-        self.modbus_host_input = create_input_field('text', '192.168.1.200')
-        self.modbus_host_input.setPlaceholderText('192.168.1.200')
-        self.modbus_host_input.setText('192.168.1.200')
-        ip_layout.addWidget(self.modbus_host_input)
-        ip_layout.addStretch()
-        layout.addLayout(ip_layout)
-        
-        # 端口设置
-        port_layout = QHBoxLayout()
-        port_layout.addWidget(create_label('端口:', bold=True))
-        self.modbus_port_input = create_input_field('number', 502, [1, 65535])
-        port_layout.addWidget(self.modbus_port_input)
-        port_layout.addStretch()
-        layout.addLayout(port_layout)
-        
-        # 从站地址
-        slave_layout = QHBoxLayout()
-        slave_layout.addWidget(create_label('从站地址:', bold=True))
-        self.modbus_slave_input = create_input_field('number', 1, [1, 255])
-        slave_layout.addWidget(self.modbus_slave_input)
-        slave_layout.addStretch()
-        layout.addLayout(slave_layout)
-        
-        # 超时设置
-        timeout_layout = QHBoxLayout()
-        timeout_layout.addWidget(create_label('超时时间(秒):', bold=True))
-        self.modbus_timeout_input = create_input_field('number', 3, [1, 60])
-        timeout_layout.addWidget(self.modbus_timeout_input)
-        timeout_layout.addStretch()
-        layout.addLayout(timeout_layout)
-        
-        # 重试次数
-        retry_layout = QHBoxLayout()
-        retry_layout.addWidget(create_label('重试次数:', bold=True))
-        self.modbus_retry_input = create_input_field('number', 3, [0, 10])
-        retry_layout.addWidget(self.modbus_retry_input)
-        retry_layout.addStretch()
-        layout.addLayout(retry_layout)
-        
+        """ModBus TCP/IP配置界面（IP地址、端口、从站地址、超时时间、重试次数）"""
+        widget, _ = self._build_form(_MODBUS_FORM)
         return widget
 
     def create_model_group(self):
@@ -1045,7 +1173,7 @@ class RobotArmControlApp(QMainWindow):
         model_group = QGroupBox('模型导入')
         model_layout = QVBoxLayout(model_group)
         self.model_combo = QComboBox()
-        self.model_combo.addItems(['Rizon 4', 'Rizon 4s', 'Rizon 10', 'Rizon 10s'])
+        self.model_combo.addItems(_MODEL_NAMES)
         model_layout.addWidget(self.model_combo)
         import_btn = QPushButton('导入模型')
         model_layout.addWidget(import_btn)
@@ -1072,10 +1200,12 @@ class RobotArmControlApp(QMainWindow):
             self.joint_values.append(value_label)
             joint_layout.addLayout(slider_layout)
             
-            # 绑定滑块事件
-            slider.valueChanged.connect(lambda value, idx=i: self.on_joint_slider_changed(idx, value))
-            slider.sliderPressed.connect(lambda idx=i: self.on_joint_slider_pressed(idx))
-            slider.sliderReleased.connect(lambda idx=i: self.on_joint_slider_released(idx))
+            # 绑定滑块事件（关节序号存为控件属性，由统一的处理函数通过sender()读取）
+            slider.setProperty('joint_idx', i)
+            slider.valueChanged.connect(self._on_joint_value_changed)
+            slider.sliderPressed.connect(self._on_joint_slider_pressed)
+            slider.sliderReleased.connect(self._on_joint_slider_released)
+        self._joint_group = joint_group
         return joint_group
 
     def create_teach_group(self):
@@ -1175,8 +1305,9 @@ class RobotArmControlApp(QMainWindow):
         ops_layout.addLayout(speed_layout)
         
         # Plan详细信息显示
-        self.plan_info_text = QTextEdit()
+        self.plan_info_text = QPlainTextEdit()
         self.plan_info_text.setReadOnly(True)
+        self.plan_info_text.setMaximumBlockCount(200)
         self.plan_info_text.setMaximumHeight(80)
         ops_layout.addWidget(self.plan_info_text)
         # 力传感器归零
@@ -1219,8 +1350,9 @@ class RobotArmControlApp(QMainWindow):
         ops_layout.addWidget(self.current_tool_label)
         # 全局变量显示
         self.btn_get_global_vars = QPushButton('显示全局变量')
-        self.global_vars_text = QTextEdit()
+        self.global_vars_text = QPlainTextEdit()
         self.global_vars_text.setReadOnly(True)
+        self.global_vars_text.setMaximumBlockCount(1000)
         ops_layout.addWidget(self.btn_get_global_vars)
         ops_layout.addWidget(self.global_vars_text)
         # 绑定事件
@@ -1230,20 +1362,23 @@ class RobotArmControlApp(QMainWindow):
         self.btn_refresh_tools.clicked.connect(self.on_refresh_tools)
         self.btn_tool_switch.clicked.connect(self.on_tool_switch)
         self.btn_get_global_vars.clicked.connect(self.on_get_global_vars)
-        # 绑定信号
-        self.robot_control.plan_list_updated.connect(self.on_plan_list_updated)
-        self.robot_control.plan_info_updated.connect(self.on_plan_info_updated)
-        self.robot_control.plan_executed.connect(self.on_plan_executed)
-        self.robot_control.plan_stopped.connect(self.on_plan_stopped)  # 新增：plan停止信号
-        self.robot_control.force_sensor_zeroed.connect(self.on_force_sensor_zeroed)
-        self.robot_control.auto_recovered.connect(self.on_auto_recovered)
-        self.robot_control.tool_updated.connect(self.on_tool_updated)
-        self.robot_control.global_vars_updated.connect(self.on_global_vars_updated)
-        self.robot_control.error_signal.connect(self.on_robot_error)
+        # 绑定信号（排队到窗口首次显示后再建立，界面构建期间不触发槽函数）
+        self._pending_connections.extend([
+            (self.robot_control.plan_list_updated, self.on_plan_list_updated),
+            (self.robot_control.plan_info_updated, self.on_plan_info_updated),
+            (self.robot_control.plan_executed, self.on_plan_executed),
+            (self.robot_control.plan_stopped, self.on_plan_stopped),  # 新增：plan停止信号
+            (self.robot_control.force_sensor_zeroed, self.on_force_sensor_zeroed),
+            (self.robot_control.auto_recovered, self.on_auto_recovered),
+            (self.robot_control.tool_updated, self.on_tool_updated),
+            (self.robot_control.global_vars_updated, self.on_global_vars_updated),
+            (self.robot_control.error_signal, self.on_robot_error, Qt.QueuedConnection),
+        ])
         return robot_ops_group
 
     def create_monitor_group(self):
         """创建监控组 - 专门显示图表和状态信息"""
+        pg = _load_pyqtgraph()
         self.monitor_group = QGroupBox('监控图表')
         main_layout = QVBoxLayout(self.monitor_group)
         main_layout.setSpacing(8)
@@ -1258,10 +1393,14 @@ class RobotArmControlApp(QMainWindow):
         self.monitor_safety_label = QLabel('安全状态: -')
         self.monitor_fault_label = QLabel('故障信息: -')
         
-        label_style = "font-size: 10px; padding: 4px; background-color: #f8f8f8; border: 1px solid #e0e0e0; border-radius: 3px;"
+        # 状态标签样式在分组上设置一次，按role属性匹配
+        status_group.setStyleSheet(
+            "QLabel[role='status'] { font-size: 10px; padding: 4px; background-color: #f8f8f8; "
+            "border: 1px solid #e0e0e0; border-radius: 3px; }"
+        )
         for label in [self.monitor_status_label, self.monitor_mode_label, 
                      self.monitor_safety_label, self.monitor_fault_label]:
-            label.setStyleSheet(label_style)
+            label.setProperty('role', 'status')
             label.setWordWrap(True)
             label.setMaximumHeight(30)
         
@@ -1312,8 +1451,8 @@ class RobotArmControlApp(QMainWindow):
             plot.getViewBox().setMenuEnabled(True)
             # 添加网格
             plot.showGrid(x=True, y=True, alpha=0.3)
-            # 添加十字光标
-            plot.getViewBox().enableAutoRange()
+            # 批量创建曲线期间关闭自动缩放，全部曲线加入后再统一开启
+            plot.getViewBox().disableAutoRange()
             # 设置背景颜色
             plot.setBackground('w')
         self.monitor_tab = QTabWidget()
@@ -1323,68 +1462,50 @@ class RobotArmControlApp(QMainWindow):
         self.monitor_tab.setMaximumHeight(550)
         
         # 设置标签页样式
-        self.monitor_tab.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                border: 1px solid #cccccc;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 6px 12px;
-                margin-right: 2px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 1px solid white;
-            }
-            QTabBar::tab:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        # 曲线对象 - 优化图例标识
-        joint_colors = ['#e41a1c','#377eb8','#4daf4a','#984ea3','#ff7f00','#a65628','#f781bf']
-        joint_names = ['关节1 (Base)', '关节2 (Shoulder)', '关节3 (Elbow)', '关节4 (Wrist1)', 
-                      '关节5 (Wrist2)', '关节6 (Wrist3)', '关节7 (Flange)']
+        self.monitor_tab.setStyleSheet(_MONITOR_TAB_QSS)
+        # 曲线对象 - 优化图例标识（颜色、名称、线型见模块级常量）
+        # 画笔统一预先创建：关节角度与关节位置曲线共用实线画笔，关节速度使用虚线画笔
+        joint_pens = [pg.mkPen(color=color, width=2) for color in _JOINT_COLORS]
+        joint_dash_pens = [pg.mkPen(color=color, width=2, style=Qt.DashLine) for color in _JOINT_COLORS]
         
         # 关节角度曲线
         self.joint_curves = []
         for i in range(7):
-            curve = self.joint_plot.plot(pen=pg.mkPen(color=joint_colors[i], width=2), name=joint_names[i])
+            curve = self.joint_plot.plot(pen=joint_pens[i], name=_JOINT_NAMES[i])
             self.joint_curves.append(curve)
         
         # TCP轨迹曲线
-        self.ee_curve = self.ee_plot.plot(pen=pg.mkPen('#2E8B57', width=2, style=pg.QtCore.Qt.SolidLine), 
-                                          symbol='o', symbolBrush='#2E8B57', symbolSize=4, name="TCP轨迹")
+        # 画笔/画刷预先创建为对象，setData重建散点时不再逐次解析颜色字符串
+        ee_pen = pg.mkPen('#2E8B57', width=2, style=Qt.SolidLine)
+        ee_brush = pg.mkBrush('#2E8B57')
+        self.ee_curve = self.ee_plot.plot(pen=ee_pen, symbol='o', symbolBrush=ee_brush,
+                                          symbolSize=4, name="TCP轨迹")
         
         # 力/力矩传感器曲线
-        ft_colors = ['#DC143C','#4169E1','#32CD32','#FF8C00','#9932CC','#8B4513']
-        ft_styles = [pg.QtCore.Qt.SolidLine, pg.QtCore.Qt.SolidLine, pg.QtCore.Qt.SolidLine, 
-                    pg.QtCore.Qt.DashLine, pg.QtCore.Qt.DashLine, pg.QtCore.Qt.DashLine]
-        ft_names = ["Fx (X轴力)", "Fy (Y轴力)", "Fz (Z轴力)", "Tx (X轴力矩)", "Ty (Y轴力矩)", "Tz (Z轴力矩)"]
+        ft_pens = [pg.mkPen(color=color, width=2, style=style) for color, style in zip(_FT_COLORS, _FT_STYLES)]
         self.ft_curves = []
-        for i, name in enumerate(ft_names):
-            curve = self.ft_plot.plot(pen=pg.mkPen(color=ft_colors[i], width=2, style=ft_styles[i]), name=name)
+        for i, name in enumerate(_FT_NAMES):
+            curve = self.ft_plot.plot(pen=ft_pens[i], name=name)
             self.ft_curves.append(curve)
         
         # 关节速度曲线
         self.vel_curves = []
         for i in range(7):
-            curve = self.vel_plot.plot(pen=pg.mkPen(color=joint_colors[i], width=2, style=pg.QtCore.Qt.DashLine), 
-                                     name=f"{joint_names[i]} 速度")
+            curve = self.vel_plot.plot(pen=joint_dash_pens[i], name=f"{_JOINT_NAMES[i]} 速度")
             self.vel_curves.append(curve)
         
         # 关节位置曲线
         self.pos_curves = []
         for i in range(7):
-            curve = self.pos_plot.plot(pen=pg.mkPen(color=joint_colors[i], width=2), name=f"{joint_names[i]} 位置")
+            curve = self.pos_plot.plot(pen=joint_pens[i], name=f"{_JOINT_NAMES[i]} 位置")
             self.pos_curves.append(curve)
+        
+        # 时间序列曲线：按峰值自动降采样，且只绘制可见范围内的数据
+        for curve in self.joint_curves + self.ft_curves + self.vel_curves + self.pos_curves:
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+        for plot in self.all_plots:
+            plot.getViewBox().enableAutoRange()
         self.monitor_tab.addTab(self.joint_plot, "关节角度")
         self.monitor_tab.addTab(self.ee_plot, "末端轨迹")
         self.monitor_tab.addTab(self.ft_plot, "力/力矩")
@@ -1403,30 +1524,10 @@ class RobotArmControlApp(QMainWindow):
         self.btn_clear_data = QPushButton('清空数据')
         self.monitor_full_btn = QPushButton('全屏')
         
-        # 设置按钮样式
-        button_style = """
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-                font-weight: bold;
-                color: #333;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-                border-color: #999;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-                border-color: #666;
-            }
-        """
-        
+        # 设置按钮样式：样式表在图表容器上设置一次，按objectName匹配各按钮
         for btn in [self.btn_reset_charts, self.btn_export_data, 
                    self.btn_clear_data, self.monitor_full_btn]:
-            btn.setStyleSheet(button_style)
+            btn.setObjectName('chartCtrlBtn')
             btn.setMaximumHeight(32)
             btn.setMinimumWidth(80)
         
@@ -1448,94 +1549,98 @@ class RobotArmControlApp(QMainWindow):
         # 创建图表容器
         chart_container = QWidget()
         chart_container.setLayout(chart_control_layout)
+        chart_container.setStyleSheet(_CHART_CTRL_BTN_QSS)
         chart_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         # 大幅增加图表区域的比例权重，确保图表获得充足的显示空间
         main_layout.addWidget(chart_container, 1)  # 图表区域占据所有剩余空间
-        # 数据缓存 - 扩展更多数据类型
-        self.joint_history = [[] for _ in range(7)]
-        self.joint_vel_history = [[] for _ in range(7)]
-        self.joint_acc_history = [[] for _ in range(7)]  # 新增加速度历史
-        self.joint_pos_history = [[] for _ in range(7)]
-        self.joint_torque_history = [[] for _ in range(7)]  # 新增力矩历史
-        self.joint_temp_history = [[] for _ in range(7)]  # 新增温度历史
-        self.time_history = []
-        self.ee_xy_history = []
-        self.ft_history = [[] for _ in range(6)]
-        self.power_history = []  # 新增功率历史
+        # 数据缓存 - 预分配的环形缓冲区，各自记录时间戳，曲线直接使用其连续视图
+        self.max_data_points = 200  # 最大数据点数
+        self.joint_history = RingBuffer(7, self.max_data_points)  # 关节角度(度)，关节角度/位置曲线共用
+        self.joint_vel_history = RingBuffer(7, self.max_data_points)  # 关节速度(度/秒)
+        self.joint_torque_history = RingBuffer(7, self.max_data_points)  # 关节力矩
+        self.ft_history = RingBuffer(6, self.max_data_points)
+        self.ee_xy_history = RingBuffer(2, 200)
+        # 暂无曲线的通道用定长deque，追加时自动丢弃最旧样本
+        self.joint_acc_history = [deque(maxlen=self.max_data_points) for _ in range(7)]  # 新增加速度历史
+        self.joint_temp_history = [deque(maxlen=self.max_data_points) for _ in range(7)]  # 新增温度历史
+        self.power_history = deque(maxlen=self.max_data_points)  # 新增功率历史
+        
+        # 曲线重绘节流：数据槽函数只写缓冲区并标记图表，定时器按固定帧率只重绘当前可见的图表
+        self._plot_sources = {
+            self.joint_plot: (self.joint_history, self.joint_curves),
+            self.pos_plot: (self.joint_history, self.pos_curves),
+            self.vel_plot: (self.joint_vel_history, self.vel_curves),
+            self.ft_plot: (self.ft_history, self.ft_curves),
+            self.ee_plot: (self.ee_xy_history, [self.ee_curve]),
+        }
+        self._dirty_plots = set()
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.timeout.connect(self._redraw_visible_plot)
+        self._redraw_timer.start(33)
+        # 切换标签页时立即绘制积压的数据
+        self.monitor_tab.currentChanged.connect(self._redraw_visible_plot)
         
         # 状态跟踪变量
         self.last_joint_angles = None
         self.last_joint_velocities = None
         self.last_time = None
-        self.max_data_points = 200  # 最大数据点数
         # 信号绑定
-        self.robot_control.joint_updated.connect(self.update_monitor_joint)
-        self.robot_control.end_effector_updated.connect(self.update_monitor_ee)
-        self.robot_control.status_updated.connect(self.update_monitor_status)
-        self.robot_control.error_signal.connect(self.update_monitor_fault)
+        self.robot_control.joint_updated.connect(self.update_monitor_joint, Qt.QueuedConnection)
+        self.robot_control.end_effector_updated.connect(self.update_monitor_ee, Qt.QueuedConnection)
+        self.robot_control.status_updated.connect(self.update_monitor_status, Qt.QueuedConnection)
+        self.robot_control.error_signal.connect(self.update_monitor_fault, Qt.QueuedConnection)
         return self.monitor_group
 
     def update_monitor_joint(self, joint_angles):
         """更新关节角度显示和历史数据"""
-        if not hasattr(self, 'joint_curves') or not self.joint_curves:
+        if not self.joint_curves:
             return
-        import time
         
         # 更新关节数据标签 - 将弧度转换为度数显示
-        if hasattr(self, 'joint_labels'):
-            for i, angle in enumerate(joint_angles):
-                if i < 7:  # A1-A7
-                    angle_deg = angle * 180 / np.pi
-                    self.joint_labels[f'A{i+1}_pos'].setText(f'{angle_deg:.2f}°')
-        
-        t = time.time()
-        self.time_history.append(t)
-        
-        # 更新关节角度历史数据（转换为度数显示）
-        for i, a in enumerate(joint_angles):
-            if i < len(self.joint_history):
-                angle_deg = a * 180 / np.pi  # 转换为度数
-                self.joint_history[i].append(angle_deg)
-                self.joint_pos_history[i].append(angle_deg)
-                
-                # 数据点数量控制
-                if len(self.joint_history[i]) > self.max_data_points:
-                    self.joint_history[i] = self.joint_history[i][-self.max_data_points:]
-                if len(self.joint_pos_history[i]) > self.max_data_points:
-                    self.joint_pos_history[i] = self.joint_pos_history[i][-self.max_data_points:]
-        
-        # 控制时间历史长度
-        if len(self.time_history) > self.max_data_points:
-            self.time_history = self.time_history[-self.max_data_points:]
-        
-        # 更新关节角度图表曲线 - 确保数组长度匹配
-        for i, curve in enumerate(self.joint_curves):
-            if i < len(self.joint_history):
-                # 确保两个数组长度相同
-                min_len = min(len(self.time_history), len(self.joint_history[i]))
-                if min_len > 0:
-                    curve.setData(self.time_history[-min_len:], self.joint_history[i][-min_len:])
-        
-        # 更新关节位置图表曲线 - 确保数组长度匹配
-        for i, curve in enumerate(self.pos_curves):
-            if i < len(self.joint_pos_history):
-                # 确保两个数组长度相同
-                min_len = min(len(self.time_history), len(self.joint_pos_history[i]))
-                if min_len > 0:
-                    curve.setData(self.time_history[-min_len:], self.joint_pos_history[i][-min_len:])
+        angles_deg = np.degrees(np.asarray(joint_angles, dtype=float))
+        if self._joint_pos_labels is not None:
+            # 一次向量化格式化前7个关节角度，只刷新文本有变化的标签
+            texts = np.char.mod('%.2f°', angles_deg[:7]).tolist()
+            last_texts = self._last_joint_pos_texts
+            for i, (label, text) in enumerate(zip(self._joint_pos_labels, texts)):  # A1-A7
+                if text != last_texts[i]:
+                    label.setText(text)
+                    last_texts[i] = text
+        
+        # 更新关节角度历史数据（度数）
+        if len(angles_deg) != 7:
+            return
+        self.joint_history.append(time.time(), angles_deg)
+        self._dirty_plots.update((self.joint_plot, self.pos_plot))
+
+    def _redraw_visible_plot(self):
+        """界面层：定时将积压的历史数据刷新到当前可见的监控图表"""
+        plot = self.monitor_tab.currentWidget()
+        if plot not in self._dirty_plots or not plot.isVisible():
+            return
+        self._dirty_plots.discard(plot)
+        history, curves = self._plot_sources[plot]
+        # 两次重绘之间缓冲区可能已写入多次，复制一份交给曲线，避免其持有的视图被后续写入改动
+        if plot is self.ee_plot:
+            # 末端轨迹为X-Y曲线
+            xy = history.view().copy()
+            self.ee_curve.setData(xy[0], xy[1])
+            return
+        times = history.times().copy()
+        for curve, series in zip(curves, history.view().copy()):
+            curve.setData(times, series)
 
     def update_monitor_ee(self, tcp_pose):
-        if not hasattr(self, 'ee_curve') or self.ee_curve is None:
+        if self.ee_curve is None:
             return
         
         # 更新TCP位置和姿态标签
-        if hasattr(self, 'tcp_labels') and len(tcp_pose) >= 3:
+        if self._tcp_value_labels is not None and len(tcp_pose) >= 3:
             # 更新位置数据 (X, Y, Z)
-            for i in range(3):
-                if i < len(tcp_pose):
-                    param = ['X', 'Y', 'Z'][i]
-                    self.tcp_labels[param].setText(f'{tcp_pose[i]:.4f} m')
+            texts = np.char.mod('%.4f m', np.asarray(tcp_pose[:3], dtype=float)).tolist()
+            for label, text in zip(self._tcp_value_labels[:3], texts):
+                label.setText(text)
             
             # 更新姿态数据（四元数转欧拉角）
             if len(tcp_pose) >= 7:  # 完整的TCP姿态数据 [x, y, z, qw, qx, qy, qz]
@@ -1545,20 +1650,15 @@ class RobotArmControlApp(QMainWindow):
                 # 转换为欧拉角（弧度）
                 roll, pitch, yaw = quaternion_to_euler(qw, qx, qy, qz)
                 
-                # 转换为度数并更新标签
-                euler_angles = [roll, pitch, yaw]
-                for i, angle_rad in enumerate(euler_angles):
-                    angle_deg = angle_rad * 180 / math.pi
-                    param = ['Rx', 'Ry', 'Rz'][i]
-                    self.tcp_labels[param].setText(f'{angle_deg:.2f}°')
+                # 转换为度数并更新标签 (Rx, Ry, Rz)
+                texts = np.char.mod('%.2f°', np.degrees([roll, pitch, yaw])).tolist()
+                for label, text in zip(self._tcp_value_labels[3:], texts):
+                    label.setText(text)
         
         # 末端轨迹（只画X-Y）
         if len(tcp_pose) >= 2:
-            self.ee_xy_history.append((tcp_pose[0], tcp_pose[1]))
-            if len(self.ee_xy_history) > 200:
-                self.ee_xy_history = self.ee_xy_history[-200:]
-            x, y = zip(*self.ee_xy_history)
-            self.ee_curve.setData(x, y)
+            self.ee_xy_history.append(time.time(), tcp_pose[:2])
+            self._dirty_plots.add(self.ee_plot)
 
     def update_monitor_status(self, status):
         self.monitor_status_label.setText(f'机器人状态: {status}')
@@ -1586,49 +1686,31 @@ class RobotArmControlApp(QMainWindow):
     def update_monitor_velocity(self, velocities):
         """更新关节速度显示"""
         # 将弧度/秒转换为度/秒显示
-        vel_text = ', '.join([f'{v * 180 / np.pi:.3f}°/s' for v in velocities])
-        if hasattr(self, 'monitor_velocity_label'):
+        vel_deg = np.degrees(np.asarray(velocities, dtype=float))
+        vel_text = ', '.join(np.char.mod('%.3f°/s', vel_deg).tolist())
+        if self.monitor_velocity_label is not None:
             self.monitor_velocity_label.setText(f'关节速度: {vel_text}')
         
         # 更新速度历史数据（转换为度/秒）
-        for i, v in enumerate(velocities):
-            if i < len(self.joint_vel_history):
-                vel_deg_per_sec = v * 180 / np.pi  # 转换为度/秒
-                self.joint_vel_history[i].append(vel_deg_per_sec)
-                if len(self.joint_vel_history[i]) > self.max_data_points:
-                    self.joint_vel_history[i] = self.joint_vel_history[i][-self.max_data_points:]
-        
-        # 更新速度图表（使用共享的时间历史） - 确保数组长度匹配
-        for i, curve in enumerate(self.vel_curves):
-            if i < len(self.joint_vel_history) and len(self.time_history) > 0:
-                # 确保两个数组长度相同
-                min_len = min(len(self.time_history), len(self.joint_vel_history[i]))
-                if min_len > 0:
-                    curve.setData(self.time_history[-min_len:], self.joint_vel_history[i][-min_len:])
+        if len(velocities) != 7:
+            return
+        self.joint_vel_history.append(time.time(), vel_deg)
+        self._dirty_plots.add(self.vel_plot)
     
     def update_monitor_torque(self, torques):
         """更新关节力矩显示"""
+        torques = np.asarray(torques, dtype=float)
         # 更新关节数据标签中的扭矩列
-        if hasattr(self, 'joint_labels'):
-            for i, torque in enumerate(torques):
-                if i < 7:  # A1-A7
-                    self.joint_labels[f'A{i+1}_torque'].setText(f'{torque:.3f} Nm')
+        if self._joint_torque_labels is not None:
+            texts = np.char.mod('%.3f Nm', torques).tolist()
+            for label, text in zip(self._joint_torque_labels, texts):  # A1-A7
+                label.setText(text)
         
         # 更新力矩历史数据
-        for i, torque in enumerate(torques):
-            if i < len(self.joint_torque_history):
-                self.joint_torque_history[i].append(torque)
-                if len(self.joint_torque_history[i]) > self.max_data_points:
-                    self.joint_torque_history[i] = self.joint_torque_history[i][-self.max_data_points:]
-        
-        # 更新力矩图表 - 确保数组长度匹配
-        if hasattr(self, 'torque_curves'):
-            for i, curve in enumerate(self.torque_curves):
-                if i < len(self.joint_torque_history) and len(self.time_history) > 0:
-                    # 确保两个数组长度相同
-                    min_len = min(len(self.time_history), len(self.joint_torque_history[i]))
-                    if min_len > 0:
-                        curve.setData(self.time_history[-min_len:], self.joint_torque_history[i][-min_len:])
+        if len(torques) != 7:
+            return
+        # 力矩暂无对应图表，只记录历史供导出；曲线统一由重绘定时器刷新，不在此逐样本setData
+        self.joint_torque_history.append(time.time(), torques)
     
     def update_monitor_mode(self, mode):
         """更新机器人模式显示"""
@@ -1639,11 +1721,10 @@ class RobotArmControlApp(QMainWindow):
         """更新力/力矩传感器数据"""
         # ft_data: [Fx, Fy, Fz, Mx, My, Mz]
         if len(ft_data) >= 6:
-            import time
             t = time.time()
             
             # 更新TCP力/力矩标签
-            if hasattr(self, 'ft_labels'):
+            if self.ft_labels is not None:
                 # 更新力数据 (Fx, Fy, Fz)
                 for i in range(3):
                     if i < len(ft_data):
@@ -1656,31 +1737,9 @@ class RobotArmControlApp(QMainWindow):
                         param = ['Mx', 'My', 'Mz'][i]
                         self.ft_labels[param].setText(f'{ft_data[i + 3]:.3f} Nm')
             
-            # 确保时间历史数据与力/力矩数据同步
-            if not hasattr(self, 'time_history'):
-                self.time_history = []
-            
-            # 只有当ft_history有数据时才添加时间戳
-            if hasattr(self, 'ft_history') and len(self.ft_history) > 0:
-                self.time_history.append(t)
-                
-                # 控制时间历史长度
-                if len(self.time_history) > self.max_data_points:
-                    self.time_history = self.time_history[-self.max_data_points:]
-            
-            for i, v in enumerate(ft_data[:6]):  # 只取前6个值
-                if i < len(self.ft_history):
-                    self.ft_history[i].append(v)
-                    if len(self.ft_history[i]) > self.max_data_points:
-                        self.ft_history[i] = self.ft_history[i][-self.max_data_points:]
-            
-            # 更新力/力矩图表 - 确保数组长度匹配
-            for i, curve in enumerate(self.ft_curves):
-                if i < len(self.ft_history) and len(self.time_history) > 0:
-                    # 确保两个数组长度相同
-                    min_len = min(len(self.time_history), len(self.ft_history[i]))
-                    if min_len > 0:
-                        curve.setData(self.time_history[-min_len:], self.ft_history[i][-min_len:])
+            # 更新力/力矩历史数据
+            self.ft_history.append(t, ft_data[:6])  # 只取前6个值
+            self._dirty_plots.add(self.ft_plot)
     
     # 新增功能函数
     def reset_chart_views(self):
@@ -1693,8 +1752,6 @@ class RobotArmControlApp(QMainWindow):
         """导出监控数据到CSV文件"""
         try:
             import csv
-            from PyQt5.QtWidgets import QFileDialog
-            import os
             
             # 选择保存文件
             file_path, _ = QFileDialog.getSaveFileName(
@@ -1719,23 +1776,28 @@ class RobotArmControlApp(QMainWindow):
                         headers.append(f'FT_{["Fx","Fy","Fz","Tx","Ty","Tz"][i]}')
                     writer.writerow(headers)
                     
-                    # 写入数据
-                    for idx, t in enumerate(self.time_history):
+                    # 写入数据（以关节角度的采样时间为行）
+                    joint_history = self.joint_history.view()
+                    vel_history = self.joint_vel_history.view()
+                    torque_history = self.joint_torque_history.view()
+                    ee_history = self.ee_xy_history.view()
+                    ft_history = self.ft_history.view()
+                    for idx, t in enumerate(self.joint_history.times()):
                         row = [t]
                         for i in range(7):
-                            row.append(self.joint_history[i][idx] if idx < len(self.joint_history[i]) else 0)
-                            row.append(self.joint_vel_history[i][idx] if idx < len(self.joint_vel_history[i]) else 0)
+                            row.append(joint_history[i][idx])
+                            row.append(vel_history[i][idx] if idx < len(vel_history[i]) else 0)
                             row.append(self.joint_acc_history[i][idx] if idx < len(self.joint_acc_history[i]) else 0)
-                            row.append(self.joint_torque_history[i][idx] if idx < len(self.joint_torque_history[i]) else 0)
+                            row.append(torque_history[i][idx] if idx < len(torque_history[i]) else 0)
                             row.append(self.joint_temp_history[i][idx] if idx < len(self.joint_temp_history[i]) else 0)
                         
                         if self.ee_xy_history and idx < len(self.ee_xy_history):
-                            row.extend(self.ee_xy_history[idx])
+                            row.extend(ee_history[:, idx])
                         else:
                             row.extend([0, 0])
                         
                         for i in range(6):
-                            row.append(self.ft_history[i][idx] if idx < len(self.ft_history[i]) else 0)
+                            row.append(ft_history[i][idx] if idx < len(ft_history[i]) else 0)
                         
                         writer.writerow(row)
                 
@@ -1746,17 +1808,18 @@ class RobotArmControlApp(QMainWindow):
     def clear_monitor_data(self):
         """清空所有监控数据"""
         try:
-            # 清空所有历史数据
-            self.joint_history = [[] for _ in range(7)]
-            self.joint_vel_history = [[] for _ in range(7)]
-            self.joint_acc_history = [[] for _ in range(7)]
-            self.joint_pos_history = [[] for _ in range(7)]
-            self.joint_torque_history = [[] for _ in range(7)]
-            self.joint_temp_history = [[] for _ in range(7)]
-            self.time_history = []
-            self.ee_xy_history = []
-            self.ft_history = [[] for _ in range(6)]
-            self.power_history = []
+            # 清空所有历史数据（环形缓冲区保留预分配内存）
+            self.joint_history.clear()
+            self.joint_vel_history.clear()
+            self.joint_torque_history.clear()
+            self.ft_history.clear()
+            self.ee_xy_history.clear()
+            for series in self.joint_acc_history:
+                series.clear()
+            for series in self.joint_temp_history:
+                series.clear()
+            self.power_history.clear()
+            self._dirty_plots.clear()
             
             # 重置状态变量
             self.last_joint_angles = None
@@ -1772,13 +1835,14 @@ class RobotArmControlApp(QMainWindow):
                 curve.setData([], [])
             for curve in self.ft_curves:
                 curve.setData([], [])
-            if hasattr(self, 'ee_curve') and self.ee_curve:
+            if self.ee_curve is not None:
                 self.ee_curve.setData([], [])
             
             # 重置标签显示
             self.monitor_joint_label.setText('关节角度: -')
             self.monitor_ee_label.setText('末端位置: -')
-            self.monitor_velocity_label.setText('关节速度: -')
+            if self.monitor_velocity_label is not None:
+                self.monitor_velocity_label.setText('关节速度: -')
             self.monitor_acceleration_label.setText('关节加速度: -')
             self.monitor_torque_label.setText('关节力矩: -')
             self.monitor_temperature_label.setText('关节温度: -')
@@ -1829,6 +1893,7 @@ class RobotArmControlApp(QMainWindow):
             if not os.path.exists(launch_path):
                 self.global_status_text.append('找不到launch文件：demo.launch')
                 return
+            import roslaunch
             uuid = roslaunch.rlutil.get_or_generate_uuid(None, False)
             roslaunch.configure_logging(uuid)
             launch = roslaunch.parent.ROSLaunchParent(uuid, [launch_path])
@@ -1862,16 +1927,37 @@ class RobotArmControlApp(QMainWindow):
         """界面层：滑块按下事件"""
         self.user_interacting = True
     
+    def _on_joint_value_changed(self, value):
+        """界面层：滑块值变化的统一入口"""
+        self.on_joint_slider_changed(self.sender().property('joint_idx'), value)
+    
+    def _on_joint_slider_pressed(self):
+        """界面层：滑块按下的统一入口"""
+        self.on_joint_slider_pressed(self.sender().property('joint_idx'))
+    
+    def _on_joint_slider_released(self):
+        """界面层：滑块释放的统一入口"""
+        self.on_joint_slider_released(self.sender().property('joint_idx'))
+    
     def on_joint_slider_released(self, joint_idx):
         """界面层：滑块释放事件"""
         # 延迟重置用户交互标记，确保拖动完成
-        QTimer.singleShot(200, lambda: setattr(self, 'user_interacting', False))
+        QTimer.singleShot(200, self._end_user_interaction)
+    
+    def _end_user_interaction(self):
+        """界面层：结束用户交互，并按最新采集状态补刷一次"""
+        self.user_interacting = False
+        self.update_timer.start()
     
     def on_joint_slider_changed(self, joint_idx, value):
         """界面层：处理关节滑块值变化"""
         angle = value
         self.joint_values[joint_idx].setText(f'{angle}°')
-        angles = [slider.value() * np.pi / 180 for slider in self.joint_sliders]
+        angles = [slider.value() * _DEG2RAD for slider in self.joint_sliders]
+        # 用户修改了滑块和渲染，使update_robot_state的显示缓存失效
+        self._last_joint_deg[joint_idx] = None
+        self._last_joint_text[joint_idx] = None
+        self._last_render_angles = None
         
         # 更新3D渲染
         self.gl_renderer.set_joint_angles(angles)
@@ -1936,7 +2022,6 @@ class RobotArmControlApp(QMainWindow):
                 # 强制触发一次渲染以初始化OpenGL
                 self.gl_renderer.update()
                 # 给OpenGL一点时间初始化
-                import time
                 time.sleep(0.1)
 
             # 只允许Qt的OpenGL窗口
@@ -2322,7 +2407,6 @@ class RobotArmControlApp(QMainWindow):
             # 检查实际连接状态
             if self.hardware and hasattr(self.robot_control, 'robot') and self.robot_control.robot:
                 # 硬件模式下检查实际连接状态
-                import time
                 # 等待连接建立
                 for i in range(10):  # 最多等待5秒
                     if self.robot_control.robot.connected():
@@ -2354,17 +2438,17 @@ class RobotArmControlApp(QMainWindow):
             
             if connection_success:
                 # 重新绑定信号
-                self.robot_control.joint_updated.connect(self.update_monitor_joint)
-                self.robot_control.end_effector_updated.connect(self.update_monitor_ee)
-                self.robot_control.status_updated.connect(self.update_monitor_status)
-                self.robot_control.error_signal.connect(self.update_monitor_fault)
+                self.robot_control.joint_updated.connect(self.update_monitor_joint, Qt.QueuedConnection)
+                self.robot_control.end_effector_updated.connect(self.update_monitor_ee, Qt.QueuedConnection)
+                self.robot_control.status_updated.connect(self.update_monitor_status, Qt.QueuedConnection)
+                self.robot_control.error_signal.connect(self.update_monitor_fault, Qt.QueuedConnection)
                 
                 # 连接新的状态信号
-                self.robot_control.robot_states_updated.connect(self.update_robot_states)
-                self.robot_control.joint_velocity_updated.connect(self.update_monitor_velocity)
-                self.robot_control.joint_torque_updated.connect(self.update_monitor_torque)
-                self.robot_control.ft_sensor_updated.connect(self.update_monitor_ft)
-                self.robot_control.mode_updated.connect(self.update_monitor_mode)
+                self.robot_control.robot_states_updated.connect(self.update_robot_states, Qt.QueuedConnection)
+                self.robot_control.joint_velocity_updated.connect(self.update_monitor_velocity, Qt.QueuedConnection)
+                self.robot_control.joint_torque_updated.connect(self.update_monitor_torque, Qt.QueuedConnection)
+                self.robot_control.ft_sensor_updated.connect(self.update_monitor_ft, Qt.QueuedConnection)
+                self.robot_control.mode_updated.connect(self.update_monitor_mode, Qt.QueuedConnection)
                 
                 self.robot_control.plan_executed.connect(self.on_plan_executed)
                 self.robot_control.force_sensor_zeroed.connect(self.on_force_sensor_zeroed)
@@ -2557,6 +2641,9 @@ class RobotArmControlApp(QMainWindow):
         else:
             # 显示3D视图，恢复分屏布局
             self.gl_renderer.setVisible(True)
+            # 隐藏期间跳过了渲染更新，立即按最新状态补刷一次
+            self._last_render_angles = None
+            self.update_robot_state()
             
             # 恢复左侧标签页的原始宽度限制
             self.left_tab.setMinimumWidth(350)
@@ -2616,14 +2703,18 @@ class RobotArmControlApp(QMainWindow):
         """窗口大小变化事件处理 - 使用防抖机制"""
         super().resizeEvent(event)
         if hasattr(self, '_adaptive_layout_enabled') and self._adaptive_layout_enabled:
-            # 使用防抖机制，避免频繁调用布局调整
-            self._pending_size = event.size()
-            self._resize_timer.stop()
-            self._resize_timer.start(100)  # 100ms延迟
+            # 使用防抖机制，避免频繁调用布局调整；尺寸与待处理尺寸相同时不重复排程
+            new_size = event.size()
+            if new_size == self._pending_size:
+                return
+            self._pending_size = new_size
+            self._resize_timer.start(120)  # 120ms延迟，start()会重新计时
     
     def _delayed_layout_adjustment(self):
         """延迟执行的布局调整方法"""
-        if self._pending_size and not self._layout_adjustment_in_progress:
+        if self._layout_adjustment_in_progress:
+            return
+        if self._pending_size:
             self._layout_adjustment_in_progress = True
             try:
                 self.adjust_layout_for_size(self._pending_size)
@@ -2989,10 +3080,32 @@ class RobotArmControlApp(QMainWindow):
         else:
             self.global_status_text.append('请先输入IP地址')
     
+    def showEvent(self, event):
+        """窗口显示后再建立界面构建期间排队的信号连接"""
+        super().showEvent(event)
+        if self._pending_connections:
+            QTimer.singleShot(0, self._flush_pending_connections)
+    
+    def _flush_pending_connections(self):
+        """通信层：建立排队的信号连接"""
+        connections, self._pending_connections = self._pending_connections, []
+        for signal, *args in connections:
+            signal.connect(*args)
+    
+    def closeEvent(self, event):
+        """窗口关闭时停止状态采集线程"""
+        self.update_timer.stop()
+        self._state_thread.quit()
+        self._state_thread.wait(1000)
+        super().closeEvent(event)
+
     def changeEvent(self, event):
         """窗口状态变化事件处理 - 优化setSizes调用"""
         super().changeEvent(event)
         if event.type() == event.WindowStateChange:
+            # 最小化期间跳过了界面刷新，还原后补刷一次
+            if not self.isMinimized() and hasattr(self, 'update_timer'):
+                self.update_timer.start()
             # 检测最大化/还原状态变化
             if self.isMaximized() and not self._is_maximized:
                 self._is_maximized = True
@@ -3072,7 +3185,9 @@ def main():
         print("完整错误堆栈:")
         traceback.print_exc()
     finally:
-        if ROS_AVAILABLE and not rospy.is_shutdown():
+        # 仅在init_ros实际导入过rospy时才需要关闭节点
+        rospy = sys.modules.get('rospy')
+        if rospy is not None and not rospy.is_shutdown():
             rospy.signal_shutdown('Application closed')
 
 if __name__ == '__main__':
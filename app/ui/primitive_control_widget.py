@@ -16,9 +16,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QMessageBox, QProgressBar, QFrame)
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont, QColor, QPalette
-import qtawesome as qta
 
 from app.control.primitive_manager import PrimitiveManager, PrimitiveParams, PrimitiveCategory
+from app.utils.ui_utils import get_icon
 
 class CoordInputWidget(QWidget):
     """坐标输入控件"""
@@ -435,17 +435,17 @@ class PrimitiveControlWidget(QWidget):
         control_layout = QHBoxLayout()
         
         self.execute_btn = QPushButton("执行 Primitive")
-        self.execute_btn.setIcon(qta.icon('fa.play'))
+        self.execute_btn.setIcon(get_icon('fa.play'))
         self.execute_btn.clicked.connect(self.execute_primitive)
         self.execute_btn.setEnabled(False)
         
         self.stop_btn = QPushButton("停止")
-        self.stop_btn.setIcon(qta.icon('fa.stop'))
+        self.stop_btn.setIcon(get_icon('fa.stop'))
         self.stop_btn.clicked.connect(self.stop_primitive)
         self.stop_btn.setEnabled(False)
         
         self.validate_btn = QPushButton("验证参数")
-        self.validate_btn.setIcon(qta.icon('fa.check'))
+        self.validate_btn.setIcon(get_icon('fa.check'))
         self.validate_btn.clicked.connect(self.validate_params)
         self.validate_btn.setEnabled(False)
         
@@ -0,0 +1,77 @@
+"""
+环形缓冲区模块
+为实时曲线提供定长、预分配的多通道历史数据存储
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    多通道定长环形缓冲区
+
+    每个样本同时写入槽位head和head+size两处，使最近的样本在内存中
+    始终连续，times()/view()返回的是切片视图，可直接交给curve.setData。
+    内部比容量多留一个槽位，保证下一次写入不会覆盖已返回视图中的数据。
+    """
+
+    __slots__ = ('capacity', '_size', '_times', '_data', '_head', '_count')
+
+    def __init__(self, channels: int, capacity: int, dtype=np.float64):
+        """
+        初始化环形缓冲区
+
+        Args:
+            channels: 通道数（如关节数）
+            capacity: 最多保留的样本数
+            dtype: 数据类型
+        """
+        self.capacity = capacity
+        self._size = capacity + 1
+        self._times = np.zeros(2 * self._size, dtype=np.float64)
+        self._data = np.zeros((channels, 2 * self._size), dtype=dtype)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, t: float, values) -> None:
+        """
+        追加一个样本
+
+        Args:
+            t: 样本时间戳
+            values: 各通道的值，长度等于通道数
+        """
+        head = self._head
+        mirror = head + self._size
+        self._times[head] = self._times[mirror] = t
+        self._data[:, head] = values
+        self._data[:, mirror] = values
+        self._head = (head + 1) % self._size
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _window(self) -> slice:
+        end = self._head + self._size
+        return slice(end - self._count, end)
+
+    def times(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: 按时间顺序排列的时间戳视图，形状(count,)
+        """
+        return self._times[self._window()]
+
+    def view(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: 按时间顺序排列的数据视图，形状(channels, count)
+        """
+        return self._data[:, self._window()]
+
+    def clear(self) -> None:
+        """清空缓冲区（不释放预分配内存）"""
+        self._head = 0
+        self._count = 0
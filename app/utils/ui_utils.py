@@ -3,13 +3,28 @@ UI工具函数模块 - 提取通用UI组件创建函数
 用于消除代码重复，提供一致的UI创建模式
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, 
                              QPushButton, QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox,
                              QCheckBox, QSplitter, QTreeWidget, QScrollArea, QFormLayout)
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
-import qtawesome as qta
+from PyQt5.QtGui import QFont, QIcon
+
+
+@lru_cache(maxsize=None)
+def get_icon(name: str) -> QIcon:
+    """
+    按名称获取qtawesome图标（首次使用时才导入qtawesome，相同图标只创建一次）
+    
+    Args:
+        name: 图标名称（qtawesome格式）
+        
+    Returns:
+        QIcon: 图标对象
+    """
+    import qtawesome
+    return qtawesome.icon(name)
 
 
 def create_group_box(title: str, layout_type: str = "vertical", 
@@ -85,7 +100,7 @@ def create_button(text: str, icon: str = None, tooltip: str = None,
         QPushButton: 配置好的按钮
     """
     if icon:
-        btn = QPushButton(qta.icon(icon), text)
+        btn = QPushButton(get_icon(icon), text)
     else:
         btn = QPushButton(text)
         
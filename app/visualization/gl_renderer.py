@@ -7,6 +7,7 @@ OpenGL渲染器 - 统一架构版本
 3. 修复OpenGL上下文问题，使用纯OpenGL渲染
 4. 优化渲染性能，添加网格缓存和显示列表
 """
+import math
 import numpy as np
 from PyQt5.QtOpenGL import QGLWidget
 from PyQt5.QtCore import QObject, pyqtSignal, Qt, QThread
@@ -16,7 +17,36 @@ from OpenGL.GLU import *
 from .urdf_parser import URDFParser
 from .mesh_loader import MeshLoader
 import trimesh
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
+
+
+def _camera_rotation_matrix(rx: float, ry: float, rz: float) -> np.ndarray:
+    """
+    合成相机旋转矩阵，等价于依次调用glRotatef(rx,1,0,0)、glRotatef(ry,0,1,0)、glRotatef(rz,0,0,1)
+    
+    Args:
+        rx, ry, rz: 绕X/Y/Z轴的旋转角度（角度制）
+    
+    Returns:
+        np.ndarray: 列主序的4x4矩阵，可直接传给glMultMatrixf
+    """
+    cx, sx = math.cos(math.radians(rx)), math.sin(math.radians(rx))
+    cy, sy = math.cos(math.radians(ry)), math.sin(math.radians(ry))
+    cz, sz = math.cos(math.radians(rz)), math.sin(math.radians(rz))
+    rot_x = np.array([[1, 0, 0, 0], [0, cx, -sx, 0], [0, sx, cx, 0], [0, 0, 0, 1]])
+    rot_y = np.array([[cy, 0, sy, 0], [0, 1, 0, 0], [-sy, 0, cy, 0], [0, 0, 0, 1]])
+    rot_z = np.array([[cz, -sz, 0, 0], [sz, cz, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+    return np.ascontiguousarray((rot_x @ rot_y @ rot_z).T, dtype=np.float32)
+
+
+# 预设视角（绕X/Y/Z轴的角度）及其旋转矩阵，模块加载时计算一次
+_PRESET_VIEW_ROTATIONS = {
+    'front': (0, 0, 0),
+    'top': (90, 0, 0),
+    'side': (0, 90, 0),
+}
+_PRESET_VIEW_MATRICES = {name: _camera_rotation_matrix(*rotation)
+                         for name, rotation in _PRESET_VIEW_ROTATIONS.items()}
 
 class GLRenderer(QGLWidget, QObject):
     """
@@ -33,6 +63,9 @@ class GLRenderer(QGLWidget, QObject):
         self.camera_distance: float = 3.0  # 从300.0改为3.0
         self.camera_rotation: List[float] = [0, 0, 0]
         self.camera_center: List[float] = [0, 0, 0]
+        # 相机旋转矩阵缓存，camera_rotation变化时才重新计算
+        self._view_matrix: np.ndarray = _PRESET_VIEW_MATRICES['front']
+        self._view_matrix_key: tuple = _PRESET_VIEW_ROTATIONS['front']
         self.last_pos: Optional[QMouseEvent] = None
         self.joint_angles: dict = {}
         self._mouse_btn: Optional[int] = None
@@ -101,9 +134,11 @@ class GLRenderer(QGLWidget, QObject):
                   self.camera_distance,
                   self.camera_center[0], self.camera_center[1], self.camera_center[2],
                   0, 1, 0)
-        glRotatef(self.camera_rotation[0], 1, 0, 0)
-        glRotatef(self.camera_rotation[1], 0, 1, 0)
-        glRotatef(self.camera_rotation[2], 0, 0, 1)
+        rotation = tuple(self.camera_rotation)
+        if rotation != self._view_matrix_key:
+            self._view_matrix = _camera_rotation_matrix(*rotation)
+            self._view_matrix_key = rotation
+        glMultMatrixf(self._view_matrix)
         self.draw_ground_grid()
         self.draw_coordinate_system()
         if self.model:
@@ -526,12 +561,16 @@ class GLRenderer(QGLWidget, QObject):
         self.update()
     def set_preset_view(self, preset):
         # preset: str, e.g. 'front', 'top', 'side'
-        if preset == 'front':
-            self.camera_rotation = [0, 0, 0]
-        elif preset == 'top':
-            self.camera_rotation = [90, 0, 0]
-        elif preset == 'side':
-            self.camera_rotation = [0, 90, 0]
+        rotation = _PRESET_VIEW_ROTATIONS.get(preset)
+        if rotation is None:
+            self.update()
+            return
+        self.apply_view_matrix(_PRESET_VIEW_MATRICES[preset], rotation)
+    def apply_view_matrix(self, matrix: np.ndarray, rotation: Sequence[float]) -> None:
+        """直接应用预先计算好的相机旋转矩阵（列主序4x4），rotation为其对应的X/Y/Z角度"""
+        self._view_matrix = matrix
+        self._view_matrix_key = tuple(rotation)
+        self.camera_rotation = list(rotation)
         self.update()
     def set_robot_model(self, urdf_path: str) -> bool:
         """加载机器人URDF模型"""